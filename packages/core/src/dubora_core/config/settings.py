@@ -33,12 +33,14 @@ def load_env_file(env_path: str | Path | None = None) -> None:
             if env_file.exists():
                 load_dotenv(env_file, override=False)  # override=False: 不覆盖已存在的环境变量
                 _env_file_dir = env_file.parent  # 保存 .env 文件所在目录
+                _clear_key_caches()
                 return
     else:
         env_path = Path(env_path)
         if env_path.exists():
             load_dotenv(env_path, override=False)
             _env_file_dir = env_path.parent  # 保存 .env 文件所在目录
+            _clear_key_caches()
 
 
 def resolve_relative_path(path: str | Path) -> Path:
@@ -113,6 +115,8 @@ def get_faststart_cache_dir() -> Path:
     return cache_dir
 
 
+# API key 读取结果缓存在进程内；load_env_file 加载新的 .env 后清空，保证后加载的 key 可见
+@lru_cache(maxsize=1)
 def get_openai_key() -> str | None:
     """
     仅从系统环境变量读取。
@@ -121,6 +125,7 @@ def get_openai_key() -> str | None:
     return os.getenv("OPENAI_KEY") or os.getenv("OPENAI_API_KEY")
 
 
+@lru_cache(maxsize=1)
 def get_gemini_key() -> str | None:
     """
     仅从系统环境变量读取。
@@ -129,6 +134,7 @@ def get_gemini_key() -> str | None:
     return os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
 
 
+@lru_cache(maxsize=1)
 def get_azure_speech_key() -> str | None:
     """
     从系统环境变量读取 Azure Speech Service 密钥。
@@ -137,6 +143,7 @@ def get_azure_speech_key() -> str | None:
     return os.getenv("AZURE_SPEECH_KEY")
 
 
+@lru_cache(maxsize=1)
 def get_azure_speech_region() -> str | None:
     """
     从系统环境变量读取 Azure Speech Service 区域。
@@ -145,6 +152,11 @@ def get_azure_speech_region() -> str | None:
     return os.getenv("AZURE_SPEECH_REGION")
 
 
+def _clear_key_caches() -> None:
+    for getter in (get_openai_key, get_gemini_key, get_azure_speech_key, get_azure_speech_region):
+        getter.cache_clear()
+
+
 @dataclass
 class PipelineConfig:
     # ── ASR 配置（豆包单源 + Gemini scene context 辅助）──
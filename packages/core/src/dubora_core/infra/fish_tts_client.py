@@ -5,7 +5,9 @@ Voice cloning mode: uses reference audio to clone speaker voice.
 Requires: pip install fish-audio-sdk
 Env: FISH_API_KEY
 """
+import os
 import time
+from functools import lru_cache
 from typing import Optional
 
 
@@ -25,6 +27,14 @@ def _is_transient(exc: BaseException) -> bool:
     return type(exc).__name__ in _TRANSIENT_EXC_NAMES
 
 
+@lru_cache(maxsize=4)
+def _get_session(api_key: str):
+    """按 api_key 复用 SDK Session（底层 httpx 连接池），并发合成共用同一组连接。"""
+    from fish_audio_sdk import Session
+
+    return Session(apikey=api_key)
+
+
 def call_fish_tts(
     text: str,
     api_key: str,
@@ -51,20 +61,19 @@ def call_fish_tts(
         Audio bytes (WAV/MP3 stream from SDK)
     """
     try:
-        from fish_audio_sdk import Session, TTSRequest
+        from fish_audio_sdk import TTSRequest
     except ImportError:
         raise ImportError(
             "fish-audio-sdk not installed. Run: pip install fish-audio-sdk"
         )
 
-    session = Session(apikey=api_key)
+    session = _get_session(api_key)
 
     req_kwargs = {"text": text}
 
     if reference_id:
         req_kwargs["reference_id"] = reference_id
     elif reference_audio:
-        import os
         if not os.path.exists(reference_audio):
             raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
         from fish_audio_sdk import ReferenceAudio
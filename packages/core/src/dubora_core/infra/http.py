@@ -0,0 +1,25 @@
+"""
+HTTP connection helpers shared by the API clients (requests + urllib3 only).
+"""
+import socket
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# TCP keepalive：空闲的池化连接不被 NAT/LB 静默回收，下一次调用无需重新 DNS + TLS
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# 系统默认空闲 2 小时才发第一个探测包，远长于常见 NAT/LB 的空闲超时；平台支持时缩短探测间隔
+for _name, _value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4)):
+    if hasattr(socket, _name):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _name), _value))
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """在池化连接上开启 SO_KEEPALIVE 的 HTTPAdapter。"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
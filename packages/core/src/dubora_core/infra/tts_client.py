@@ -5,12 +5,32 @@ Extracted from pipeline/processors/tts/volcengine.py so that both web (voice pre
 and pipeline (full TTS synthesis) can use it without cross-package imports.
 """
 import base64
+import itertools
 import json
 import os
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
+from urllib3.util.retry import Retry
+
+from dubora_core.infra.http import KeepAliveAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 流式响应逐行解析：orjson 直接吃 bytes，缺失时回退 stdlib json（同样接受 bytes）
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    """请求体序列化（ICL 模式下 body 含整段 base64 参考音频，orjson 明显更快）。"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 # VolcEngine API configuration
@@ -19,6 +39,44 @@ DEFAULT_RESOURCE_ID = "seed-tts-1.0"
 DEFAULT_FORMAT = "pcm"
 DEFAULT_SAMPLE_RATE = 24000
 
+# X-Api-Request-Id：进程级随机前缀 + 自增计数，全局唯一且无需每次调用 uuid4
+_REQUEST_ID_PREFIX = uuid.uuid4().hex
+_request_id_counter = itertools.count()
+
+# 连接池大小：覆盖 pipeline 并发合成的 worker 数，避免在默认 10 连接池上排队
+_POOL_MAXSIZE = 16
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """进程级共享 Session：复用 keep-alive 连接，省掉每次调用的 TLS 握手。"""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    # pool_block：并发超过池大小时排队等已有连接，而不是新建一次性连接（每条都要 DNS + TLS）
+    adapter = KeepAliveAdapter(
+        pool_connections=_POOL_MAXSIZE,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=retry,
+        pool_block=True,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=8)
+def _load_reference_audio_b64(path: str, mtime_ns: int, size: int) -> tuple[str, int]:
+    """ICL 参考音频 → base64。同一角色的所有片段共用一份参考音频，按 (path, mtime, size) 缓存，
+    避免每个片段都重新读文件 + 编码。"""
+    with open(path, "rb") as rf:
+        ref_bytes = rf.read()
+    return base64.b64encode(ref_bytes).decode("utf-8"), len(ref_bytes)
+
 
 def call_volcengine_tts(
     text: str,
@@ -58,52 +116,52 @@ def call_volcengine_tts(
     Returns:
         (audio_bytes, sentence_data) tuple
     """
-    request_id = str(uuid.uuid4())
+    request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_id_counter)}"
 
     # ICL mode
     if reference_audio and os.path.exists(reference_audio):
         resource_id = kwargs.pop("icl_resource_id", "seed-tts-icl-2.0")
-        with open(reference_audio, "rb") as rf:
-            ref_bytes = rf.read()
-        ref_audio_b64 = base64.b64encode(ref_bytes).decode("utf-8")
-        print(f"  ICL mode: reference_audio={reference_audio} ({len(ref_bytes)} bytes), resource_id={resource_id}")
+        st = os.stat(reference_audio)
+        ref_audio_b64, ref_size = _load_reference_audio_b64(reference_audio, st.st_mtime_ns, st.st_size)
+        print(f"  ICL mode: reference_audio={reference_audio} ({ref_size} bytes), resource_id={resource_id}")
     else:
         ref_audio_b64 = None
 
-    # Build request body
-    body: Dict[str, Any] = {
-        "user": {
-            "uid": kwargs.get("uid", "dubora_user")
-        },
-        "req_params": {
-            "text": text,
-            "speaker": speaker,
-            "audio_params": {
-                "format": format,
-                "sample_rate": sample_rate,
-            }
-        }
+    # Build request body：audio_params / req_params 先各自组装，避免反复 body["req_params"]["audio_params"] 链式下标
+    audio_params: dict[str, Any] = {
+        "format": format,
+        "sample_rate": sample_rate,
     }
-
-    if ref_audio_b64:
-        body["req_params"]["reference_audio"] = ref_audio_b64
-
     if speed_ratio != 1.0:
-        body["req_params"]["audio_params"]["speed_ratio"] = speed_ratio
+        audio_params["speed_ratio"] = speed_ratio
     elif speech_rate != 0.0:
-        body["req_params"]["audio_params"]["speech_rate"] = speech_rate
+        audio_params["speech_rate"] = speech_rate
 
     if emotion:
-        body["req_params"]["audio_params"]["emotion"] = emotion
-        body["req_params"]["audio_params"]["emotion_scale"] = emotion_scale
+        audio_params["emotion"] = emotion
+        audio_params["emotion_scale"] = emotion_scale
 
     if enable_timestamp:
-        body["req_params"]["audio_params"]["enable_timestamp"] = True
+        audio_params["enable_timestamp"] = True
     if enable_subtitle:
-        body["req_params"]["audio_params"]["enable_subtitle"] = True
+        audio_params["enable_subtitle"] = True
 
+    req_params: dict[str, Any] = {
+        "text": text,
+        "speaker": speaker,
+        "audio_params": audio_params,
+    }
+    if ref_audio_b64:
+        req_params["reference_audio"] = ref_audio_b64
     if "additions" in kwargs:
-        body["req_params"]["additions"] = kwargs["additions"]
+        req_params["additions"] = kwargs["additions"]
+
+    body: dict[str, Any] = {
+        "user": {
+            "uid": kwargs.get("uid", "dubora_user")
+        },
+        "req_params": req_params,
+    }
 
     headers = {
         "Content-Type": "application/json",
@@ -113,61 +171,64 @@ def call_volcengine_tts(
         "X-Api-Request-Id": request_id,
     }
 
-    session = requests.Session()
-    response = session.post(
+    with _get_session().post(
         VOLC_API_URL,
         headers=headers,
-        json=body,
+        data=_dumps(body),
         stream=True,
         timeout=60,
-    )
-
-    response.raise_for_status()
-
-    audio_data = bytearray()
-    sentence_data = None
-    chunk_count = 0
-    total_audio_size = 0
-
-    for chunk in response.iter_lines(decode_unicode=True):
-        if not chunk:
-            continue
-
-        try:
-            data = json.loads(chunk)
-            code = data.get("code", 0)
-
-            if code == 0 and "data" in data and data["data"]:
-                try:
-                    chunk_audio = base64.b64decode(data["data"])
-                    audio_size = len(chunk_audio)
-                    total_audio_size += audio_size
-                    audio_data.extend(chunk_audio)
-                    chunk_count += 1
-                    if chunk_count <= 5:
-                        print(f"  Chunk {chunk_count}: decoded {audio_size} bytes, total: {total_audio_size} bytes")
-                except Exception as e:
-                    print(f"  Failed to decode chunk {chunk_count + 1}: {e}")
-                    continue
-
-            if code == 0 and "sentence" in data and data["sentence"]:
-                sentence_data = data.get("sentence")
-                print("  Received sentence data")
-
-            if code == 20000000:
-                if 'usage' in data:
-                    print(f"  Usage: {data['usage']}")
-                print(f"  Received end marker (code=20000000), total chunks: {chunk_count}, total audio: {total_audio_size} bytes")
-                break
-
-            if code > 0 and code != 20000000:
-                print(f"  Error response: {data}")
-                message = data.get("message", "Unknown error")
-                raise RuntimeError(f"VolcEngine TTS API error: code={code}, message={message}")
-
-        except json.JSONDecodeError as e:
-            print(f"  JSON decode error: {e}, chunk: {chunk[:100]}")
-            continue
+    ) as response:
+        response.raise_for_status()
+
+        audio_data = bytearray()
+        sentence_data = None
+        chunk_count = 0
+        total_audio_size = 0
+
+        # 按 bytes 逐行读取，省掉每行的 str 解码拷贝
+        for chunk in response.iter_lines():
+            if not chunk:
+                continue
+
+            try:
+                data = _loads(chunk)
+                code = data.get("code", 0)
+
+                if code == 0 and "data" in data and data["data"]:
+                    try:
+                        chunk_audio = base64.b64decode(data["data"])
+                        audio_size = len(chunk_audio)
+                        total_audio_size += audio_size
+                        audio_data.extend(chunk_audio)
+                        chunk_count += 1
+                        if chunk_count <= 5:
+                            print(f"  Chunk {chunk_count}: decoded {audio_size} bytes, total: {total_audio_size} bytes")
+                    except Exception as e:
+                        print(f"  Failed to decode chunk {chunk_count + 1}: {e}")
+                        continue
+
+                if code == 0 and "sentence" in data and data["sentence"]:
+                    sentence_data = data.get("sentence")
+                    print("  Received sentence data")
+
+                if code == 20000000:
+                    if 'usage' in data:
+                        print(f"  Usage: {data['usage']}")
+                    print(f"  Received end marker (code=20000000), total chunks: {chunk_count}, total audio: {total_audio_size} bytes")
+                    # 读完结束标记之后的剩余响应体再退出：流没读完就 close 会直接断开连接，
+                    # 读完才会把连接放回连接池给下一次调用复用
+                    for _ in response.iter_content(chunk_size=8192):
+                        pass
+                    break
+
+                if code > 0 and code != 20000000:
+                    print(f"  Error response: {data}")
+                    message = data.get("message", "Unknown error")
+                    raise RuntimeError(f"VolcEngine TTS API error: code={code}, message={message}")
+
+            except json.JSONDecodeError as e:
+                print(f"  JSON decode error: {e}, chunk: {chunk[:100]}")
+                continue
 
     if not audio_data:
         raise RuntimeError("No audio data received from VolcEngine TTS API")
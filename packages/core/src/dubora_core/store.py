@@ -1059,11 +1059,9 @@ class DbStore:
         for utt in utts:
             utt = dict(utt)
             cues = self.get_cues_for_utterance(utt["id"])
-            text_cn = "".join(c.get("text", "") for c in cues)
-            text_en = " ".join(
-                c.get("text_en", "").strip() for c in cues
-                if c.get("text_en", "").strip()
-            )
+            text_cn = "".join([c.get("text", "") for c in cues])
+            en_parts = [c.get("text_en", "").strip() for c in cues]
+            text_en = " ".join([t for t in en_parts if t])
             updates: dict = {}
             if text_cn != (utt.get("text_cn") or ""):
                 updates["text_cn"] = text_cn
@@ -1148,13 +1146,23 @@ class DbStore:
         ).fetchall()
         existing_utts = [dict(r) for r in existing_utts]
 
-        existing_cue_sets: dict[int, frozenset[int]] = {}
-        for utt in existing_utts:
-            links = self._execute(
-                "SELECT cue_id FROM utterance_cues WHERE utterance_id=%s",
-                (utt["id"],),
-            ).fetchall()
-            existing_cue_sets[utt["id"]] = frozenset(r["cue_id"] for r in links)
+        # 一次查出本集所有 junction 行，按 utterance_id 分组（替代逐 utterance 查询）
+        all_links = self._execute(
+            """SELECT uc.utterance_id, uc.cue_id
+               FROM utterance_cues uc
+               JOIN utterances u ON uc.utterance_id = u.id
+               WHERE u.episode_id = %s""",
+            (episode_id,),
+        ).fetchall()
+        from collections import defaultdict
+        links_by_utt: dict[int, list[int]] = defaultdict(list)
+        for row in all_links:
+            links_by_utt[row["utterance_id"]].append(row["cue_id"])
+
+        existing_cue_sets: dict[int, frozenset[int]] = {
+            utt["id"]: frozenset(links_by_utt.get(utt["id"], ()))
+            for utt in existing_utts
+        }
 
         # Build reverse map: cue_id_set → existing utterance
         cue_set_to_utt: dict[frozenset[int], dict] = {}
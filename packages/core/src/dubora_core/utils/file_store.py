@@ -26,6 +26,8 @@ Usage:
 import hashlib
 import os
 import shutil
+import tempfile
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import timedelta
@@ -207,6 +209,31 @@ class TOSBackend(StorageBackend):
 # ── RemoteFileStore ──────────────────────────────────────────────────────────
 
 
+# 签名 URL 在有效期前 3/4 内复用，保证调用方拿到的 URL 至少还剩 1/4 有效期
+_URL_REUSE_FRACTION = 0.75
+_URL_CACHE_MAX = 4096
+
+
+def _write_private_atomic(path: Path, text: str) -> None:
+    """Write text via temp file + os.replace, readable by the owner only.
+
+    Presigned URLs are bearer credentials: the 0o600 temp file (mkstemp
+    default) keeps them private, and the rename means concurrent readers
+    never see a half-written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 class RemoteFileStore:
     """File store: local cache_dir + remote backend, key-unified API.
 
@@ -219,6 +246,8 @@ class RemoteFileStore:
         self.backend = backend
         self.cache_dir = cache_dir
         self.name = name or type(backend).__name__
+        # (key, expires) -> (url, reuse_until monotonic)
+        self._url_cache: dict[tuple[str, int], tuple[str, float]] = {}
 
     # ── Internal ──────────────────────────────────────────────
 
@@ -230,6 +259,10 @@ class RemoteFileStore:
         """key -> .sync file path."""
         return self.cache_dir / ".sync" / f"{key}.sync"
 
+    def _url_path(self, key: str) -> Path:
+        """key -> cached presigned URL file path."""
+        return self.cache_dir / ".sync" / f"{key}.url"
+
     def _calc_sha256(self, key: str) -> str:
         """Compute SHA256 of local cached file."""
         return sha256_file(self._local_path(key))
@@ -389,10 +422,48 @@ class RemoteFileStore:
         """Delete local cached file + .sync."""
         self._local_path(key).unlink(missing_ok=True)
         self._sync_path(key).unlink(missing_ok=True)
+        self._url_path(key).unlink(missing_ok=True)
 
     def get_url(self, key: str, expires: int = 3600) -> str:
-        """Generate a presigned remote URL for the key."""
-        return self.backend.get_url(key, expires=expires)
+        """Generate a presigned remote URL for the key.
+
+        Signed URLs are cached per (key, expires) and reused for most of their
+        lifetime, so repeated listings skip re-signing and hand out identical
+        URLs (browser/CDN cache friendly). The signed URL is also persisted next
+        to the key's .sync file (atomically, mode 0o600) so later runs reuse it
+        within the same window.
+        """
+        now = time.monotonic()
+        cache_key = (key, expires)
+        hit = self._url_cache.get(cache_key)
+        if hit is not None and hit[1] > now:
+            return hit[0]
+
+        # Cross-run cache: .sync/{key}.url holds "expires reuse_until_epoch url"
+        url_path = self._url_path(key)
+        wall = time.time()
+        url = None
+        try:
+            saved_expires, saved_until, saved_url = url_path.read_text().split(" ", 2)
+            if int(saved_expires) == expires and float(saved_until) > wall:
+                url = saved_url
+                reuse_for = float(saved_until) - wall
+        except (OSError, ValueError):
+            pass
+
+        if url is None:
+            url = self.backend.get_url(key, expires=expires)
+            reuse_for = expires * _URL_REUSE_FRACTION
+            try:
+                url_path.parent.mkdir(parents=True, exist_ok=True)
+                _write_private_atomic(url_path, f"{expires} {wall + reuse_for:.0f} {url}")
+            except OSError:
+                pass
+
+        if len(self._url_cache) >= _URL_CACHE_MAX:
+            self._url_cache.clear()
+        self._url_cache[cache_key] = (url, now + reuse_for)
+        return url
 
 
 # ── Concrete subclasses ──────────────────────────────────────────────────────
@@ -3,9 +3,17 @@
 
 提供统一的日志接口，替代直接使用 print。
 支持不同级别的日志输出，不包含 emoji。
+
+消息支持 logging 风格的惰性格式化：info("状态: %s", status) 只在该级别
+实际输出时才做 % 格式化。最低输出级别由环境变量 DUBORA_LOG_LEVEL 控制
+（DEBUG/INFO/SUCCESS/WARN/ERROR，默认 DEBUG 即全部输出）。
 """
+import os
 import sys
 
+_LEVELS = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARN": 30, "WARNING": 30, "ERROR": 40}
+_threshold = _LEVELS.get(os.getenv("DUBORA_LOG_LEVEL", "DEBUG").upper(), 10)
+
 
 class Logger:
     """简单的日志记录器，不依赖 logging 模块"""
@@ -19,54 +27,61 @@ class Logger:
             return f"[{level}] {self.prefix}: {message}"
         return f"[{level}] {message}"
     
-    def info(self, message: str):
+    def _emit(self, level: str, message: str, args: tuple, stream) -> None:
+        if _LEVELS[level] < _threshold:
+            return
+        if args:
+            message = message % args
+        print(self._format(level, message), file=stream)
+    
+    def info(self, message: str, *args):
         """信息级别日志"""
-        print(self._format("INFO", message), file=sys.stdout)
+        self._emit("INFO", message, args, sys.stdout)
     
-    def success(self, message: str):
+    def success(self, message: str, *args):
         """成功级别日志"""
-        print(self._format("SUCCESS", message), file=sys.stdout)
+        self._emit("SUCCESS", message, args, sys.stdout)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """警告级别日志"""
-        print(self._format("WARN", message), file=sys.stderr)
+        self._emit("WARN", message, args, sys.stderr)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """错误级别日志"""
-        print(self._format("ERROR", message), file=sys.stderr)
+        self._emit("ERROR", message, args, sys.stderr)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """调试级别日志"""
-        print(self._format("DEBUG", message), file=sys.stdout)
+        self._emit("DEBUG", message, args, sys.stdout)
 
 
 # 全局默认日志记录器
 _default_logger = Logger()
 
 
-def info(message: str):
+def info(message: str, *args):
     """信息级别日志"""
-    _default_logger.info(message)
+    _default_logger.info(message, *args)
 
 
-def success(message: str):
+def success(message: str, *args):
     """成功级别日志"""
-    _default_logger.success(message)
+    _default_logger.success(message, *args)
 
 
-def warning(message: str):
+def warning(message: str, *args):
     """警告级别日志"""
-    _default_logger.warning(message)
+    _default_logger.warning(message, *args)
 
 
-def error(message: str):
+def error(message: str, *args):
     """错误级别日志"""
-    _default_logger.error(message)
+    _default_logger.error(message, *args)
 
 
-def debug(message: str):
+def debug(message: str, *args):
     """调试级别日志"""
-    _default_logger.debug(message)
+    _default_logger.debug(message, *args)
 
 
 def get_logger(prefix: str = "") -> Logger:
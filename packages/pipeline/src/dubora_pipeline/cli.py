@@ -8,20 +8,24 @@ Commands:
   vsd-pipeline worker --api-url http://web:8765 # Remote mode (via HTTP API)
   vsd-pipeline phases                           # List phases
 """
+from __future__ import annotations
+
 import argparse
 import os
 import re
 import sys
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, List
 
 from dubora_core.config.settings import PipelineConfig, load_env_file, get_database_url
 from dubora_core.phase_registry import PHASE_NAMES, PHASE_META, GATES, GATE_AFTER, STAGES
-from dubora_core.store import DbStore
-from dubora_core.submit import submit_pipeline
-from dubora_pipeline.phases import build_phases
-from dubora_pipeline.worker import PipelineWorker
 from dubora_core.utils.logger import info, warning, error, success
 
+# DB 驱动 / phases / worker 依赖较重，延迟到具体命令里再导入，
+# 让 --help、phases 等命令不为用不到的模块付启动开销
+if TYPE_CHECKING:
+    from dubora_core.store import DbStore
+
 
 def expand_episode_range(ep_arg: str) -> List[str]:
     m = re.match(r'^(\d+)-(\d+)$', ep_arg)
@@ -32,14 +36,18 @@ def expand_episode_range(ep_arg: str) -> List[str]:
 
 
 def get_store() -> DbStore:
+    from dubora_core.store import DbStore
     return DbStore(get_database_url())
 
 
+class EpisodeResolveError(RuntimeError):
+    """剧集/集数在 DB 中找不到。由 main() 统一转成退出码，库函数本身不退出进程。"""
+
+
 def resolve_episodes(store: DbStore, drama_name: str, ep_arg: str) -> list[dict]:
     drama = store.get_drama_by_name(drama_name)
     if drama is None:
-        error(f"Drama not found in DB: {drama_name}")
-        sys.exit(1)
+        raise EpisodeResolveError(f"Drama not found in DB: {drama_name}")
 
     ep_numbers = expand_episode_range(ep_arg)
     episodes = []
@@ -51,18 +59,12 @@ def resolve_episodes(store: DbStore, drama_name: str, ep_arg: str) -> list[dict]
             episodes.append(ep)
 
     if not episodes:
-        error("No matching episodes found in DB")
-        sys.exit(1)
+        raise EpisodeResolveError("No matching episodes found in DB")
 
     return episodes
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="Video dubbing pipeline",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+_EPILOG = f"""
 Phases: {' -> '.join(PHASE_NAMES)}
 
 Examples:
@@ -72,6 +74,15 @@ Examples:
   vsd-pipeline worker                               # Start task executor (local DB)
   vsd-pipeline worker --api-url http://web:8765     # Start task executor (remote API)
         """
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """构建 CLI parser（缓存：被其他脚本 import 后反复调用 main() 时只构建一次）。"""
+    parser = argparse.ArgumentParser(
+        description="Video dubbing pipeline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Command")
@@ -92,6 +103,7 @@ Examples:
         "--api-url", type=str, default=None,
         help="Web API URL for remote submission (e.g. http://web:8765)",
     )
+    run_parser.set_defaults(handler=_cmd_run)
 
     # worker command
     worker_parser = subparsers.add_parser("worker", help="Start long-running task executor")
@@ -99,6 +111,7 @@ Examples:
         "--api-url", type=str, default=None,
         help="Web API URL for remote mode (e.g. http://web:8765)",
     )
+    worker_parser.set_defaults(handler=_cmd_worker)
 
     # gate command
     gate_parser = subparsers.add_parser("gate", help="Pass a pipeline gate to continue execution")
@@ -109,17 +122,25 @@ Examples:
         choices=[g["key"] for g in GATES],
         help="Gate key (default: auto-detect pending gate)",
     )
+    gate_parser.set_defaults(handler=_cmd_gate)
 
     # phases command
-    subparsers.add_parser("phases", help="List available phases")
+    phases_parser = subparsers.add_parser("phases", help="List available phases")
+    phases_parser.set_defaults(handler=_cmd_phases)
+
+    return parser
 
+
+def main():
+    """Main CLI entry point"""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    if args.command == "run" and getattr(args, "from_phase", None) and getattr(args, "to", None):
+    if args.command == "run" and args.from_phase and args.to:
         from_idx = PHASE_NAMES.index(args.from_phase)
         to_idx = PHASE_NAMES.index(args.to)
         if from_idx > to_idx:
@@ -127,25 +148,12 @@ Examples:
 
     load_env_file()
 
-    if args.command == "phases":
-        _cmd_phases()
-        return
-
-    if args.command == "gate":
-        _cmd_gate(args)
-        return
-
-    if args.command == "worker":
-        api_url = getattr(args, "api_url", None) or os.environ.get("API_URL")
-        _cmd_worker(api_url=api_url)
-        return
-
-    # ── run ──
-    api_url = getattr(args, "api_url", None) or os.environ.get("API_URL")
-    if api_url:
-        _cmd_run_remote(api_url, args)
-    else:
-        _cmd_run_local(args)
+    # 每个子命令通过 set_defaults 绑定自己的 handler，直接分发
+    try:
+        args.handler(args)
+    except EpisodeResolveError as e:
+        error(str(e))
+        sys.exit(1)
 
 
 def _cmd_gate(args):
@@ -191,7 +199,7 @@ def _cmd_gate(args):
         success(f"[ep {ep['number']}] Gate '{gate_key}' passed")
 
 
-def _cmd_phases():
+def _cmd_phases(args):
     meta_map = {m["name"]: m for m in PHASE_META}
     gate_count = len(GATE_AFTER)
     print(f"\nPipeline ({len(PHASE_META)} phases, {gate_count} gates):\n")
@@ -208,7 +216,11 @@ def _cmd_phases():
     print()
 
 
-def _cmd_worker(*, api_url: str | None = None):
+def _cmd_worker(args):
+    from dubora_pipeline.phases import build_phases
+    from dubora_pipeline.worker import PipelineWorker
+
+    api_url = args.api_url or os.environ.get("API_URL")
     config = PipelineConfig()
     phases = build_phases(config)
 
@@ -242,8 +254,18 @@ def _cmd_worker(*, api_url: str | None = None):
         info("Worker stopped")
 
 
+def _cmd_run(args):
+    api_url = args.api_url or os.environ.get("API_URL")
+    if api_url:
+        _cmd_run_remote(api_url, args)
+    else:
+        _cmd_run_local(args)
+
+
 def _cmd_run_local(args):
     """Submit pipeline via local DB."""
+    from dubora_core.submit import submit_pipeline
+
     store = get_store()
     episodes = resolve_episodes(store, args.drama, args.episodes)
     is_batch = len(episodes) > 1
@@ -13,14 +13,50 @@ Doubao ASR 客户端：纯 API 调用（HTTP 客户端）
 """
 from __future__ import annotations
 
+import json
+import random
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 import requests
+from dubora_core.infra.http import KeepAliveAdapter
+from dubora_core.utils.logger import info
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .request_types import DoubaoASRRequest
 
+# /query 的 body 恒为 {}，预先序列化一次
+_QUERY_BODY = b"{}"
+
+# X-Api-Status-Code 中表示受理/处理中/成功的业务码
+_OK_STATUS_CODES = frozenset({"20000000", "20000001", "20000002", "20000003"})
+
+# 任务明确失败的状态（正常状态：processing, pending, success, completed, done）
+_ERROR_STATUSES = frozenset({"failed", "error", "timeout", "cancelled", "rejected"})
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _body_snippet(r: requests.Response, limit: int = 300) -> str:
+    """错误信息里的响应体片段：直接截取原始字节再解码，不对整个 body 做编码探测/解码"""
+    return r.content[:limit].decode("utf-8", errors="replace")
+
 
 class DoubaoASRClient:
     """
@@ -38,7 +74,10 @@ class DoubaoASRClient:
         self.app_key = app_key
         self.access_key = access_key
         self.timeout_s = timeout_s
+        # 轮询间隔可达十几秒，开 TCP keepalive 让池化连接不被中间设备回收；
+        # 池大小覆盖 poll_many 的并发查询线程
         self.session = requests.Session()
+        self.session.mount("https://", KeepAliveAdapter(pool_connections=4, pool_maxsize=16))
 
     def _headers(self, resource_id: str, request_id: str) -> Dict[str, str]:
         return {
@@ -63,7 +102,7 @@ class DoubaoASRClient:
         r = self.session.post(
             self.SUBMIT_URL,
             headers=self._headers(resource_id, request_id),
-            json=body,
+            data=_dumps(body),
             timeout=self.timeout_s,
         )
 
@@ -76,51 +115,93 @@ class DoubaoASRClient:
             raise RuntimeError(
                 f"Submit HTTP failed: http={r.status_code}, "
                 f"X-Api-Status-Code={status_code}, X-Api-Message={message}, "
-                f"body={r.text[:300]}"
+                f"body={_body_snippet(r)}"
             )
 
         # 业务状态码缺失：不要默默放行（否则你排查会疯）
         if status_code is None:
             raise RuntimeError(
-                f"Submit returned no X-Api-Status-Code header: http={r.status_code}, body={r.text[:300]}"
+                f"Submit returned no X-Api-Status-Code header: http={r.status_code}, body={_body_snippet(r)}"
             )
 
-        ok = {"20000000", "20000001", "20000002", "20000003"}
-        if status_code not in ok:
+        if status_code not in _OK_STATUS_CODES:
             raise RuntimeError(
                 f"Submit failed: X-Api-Status-Code={status_code}, X-Api-Message={message}, "
-                f"http={r.status_code}, body={r.text[:300]}"
+                f"http={r.status_code}, body={_body_snippet(r)}"
             )
 
         return request_id
 
     def query(self, request_id: str, resource_id: str) -> Dict[str, Any]:
+        return self._query(self._headers(resource_id, request_id))
+
+    def _query(self, headers: dict[str, str]) -> dict[str, Any]:
         r = self.session.post(
             self.QUERY_URL,
-            headers=self._headers(resource_id, request_id),
-            json={},
+            headers=headers,
+            data=_QUERY_BODY,
             timeout=self.timeout_s,
         )
         
         # 检查 HTTP 状态码
         if r.status_code >= 400:
-            raise RuntimeError(f"Query HTTP failed: http={r.status_code}, body={r.text[:300]}")
+            raise RuntimeError(f"Query HTTP failed: http={r.status_code}, body={_body_snippet(r)}")
         
         # 检查豆包 API 状态码（通过 header 返回）
         status_code = r.headers.get("X-Api-Status-Code")
         message = r.headers.get("X-Api-Message", "")
         
         # 如果状态码表示错误（不是成功状态码），立即抛出异常
-        if status_code and status_code not in ("20000000", "20000001", "20000002", "20000003", None):
+        if status_code and status_code not in _OK_STATUS_CODES:
             raise RuntimeError(
                 f"Query failed: X-Api-Status-Code={status_code}, X-Api-Message={message}, "
-                f"http={r.status_code}, body={r.text[:300]}"
+                f"http={r.status_code}, body={_body_snippet(r)}"
             )
         
         try:
-            return r.json()
-        except Exception as e:
-            raise RuntimeError(f"Query returned non-JSON: {e}; body={r.text[:300]}")
+            return _loads(r.content)
+        except ValueError as e:
+            raise RuntimeError(f"Query returned non-JSON: {e}; body={_body_snippet(r)}") from e
+
+    @staticmethod
+    def _is_finished(j: dict[str, Any]) -> bool:
+        """
+        判断 /query 响应是否已完成：有 utterances 返回 True，仍在处理返回 False，
+        明确失败状态则抛 RuntimeError。
+        """
+        result = j.get("result")
+        
+        # 优先检查是否有 utterances（表示任务完成）
+        if isinstance(result, dict) and result.get("utterances"):
+            return True
+        
+        # Some versions return a list at top-level "result"
+        if isinstance(result, list) and len(result) > 0:
+            for item in result:
+                if isinstance(item, dict) and item.get("utterances"):
+                    return True
+        
+        # 检查任务是否失败（只检查明确的错误状态）
+        if isinstance(result, dict):
+            result_status = result.get("status", "").lower() if result.get("status") else ""
+            if result_status in _ERROR_STATUSES:
+                error_msg = result.get("message") or result.get("error") or f"任务状态: {result_status}"
+                raise RuntimeError(f"任务失败: {error_msg}, 响应: {j}")
+        
+        if isinstance(result, list):
+            for item in result:
+                if isinstance(item, dict):
+                    item_status = item.get("status", "").lower() if item.get("status") else ""
+                    if item_status in _ERROR_STATUSES:
+                        error_msg = item.get("message") or item.get("error") or f"任务状态: {item_status}"
+                        raise RuntimeError(f"任务失败: {error_msg}, 响应: {j}")
+        
+        # 检查顶层状态字段
+        top_status = (j.get("status") or "").lower() if j.get("status") else ""
+        if top_status in _ERROR_STATUSES:
+            error_msg = j.get("message") or j.get("error") or f"任务状态: {top_status}"
+            raise RuntimeError(f"任务失败: {error_msg}, 响应: {j}")
+        return False
 
     def submit_and_poll(
             self,
@@ -128,29 +209,38 @@ class DoubaoASRClient:
             *,
             resource_id: str,
             poll_interval_s: float = 2.0,
+            max_poll_interval_s: float = 15.0,
             max_wait_s: int = 3600,
     ) -> Dict[str, Any]:
         """
         Returns the final JSON response from /query.
+
+        轮询间隔从 poll_interval_s 起按 1.5 倍指数退避，上限 max_poll_interval_s，
+        并加少量随机抖动，避免长音频任务在前期密集空轮询。
         """
-        # 添加日志输出
-        from dubora_core.utils.logger import info
-        
         info("提交任务到豆包 API...")
         req_id = self.submit(req, resource_id=resource_id)
         info(f"任务已提交，request_id: {req_id}")
-        info(f"开始轮询查询结果（每 {poll_interval_s} 秒查询一次，最长等待 {max_wait_s} 秒）...")
+        info(
+            f"开始轮询查询结果（间隔 {poll_interval_s} 秒起指数退避，上限 {max_poll_interval_s} 秒，"
+            f"最长等待 {max_wait_s} 秒）..."
+        )
 
-        deadline = time.time() + max_wait_s
+        # monotonic 不受系统时钟回拨影响
+        start = time.monotonic()
+        deadline = start + max_wait_s
         last_json: Optional[Dict[str, Any]] = None
+        last_status: str | None = None
         poll_count = 0
+        delay = poll_interval_s
+        # 轮询期间 headers 不变，只构建一次
+        query_headers = self._headers(resource_id, req_id)
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             poll_count += 1
-            info(f"第 {poll_count} 次查询任务状态...")
-            
+
             try:
-                j = self.query(req_id, resource_id)
+                j = self._query(query_headers)
             except RuntimeError as e:
                 # 查询失败，立即抛出错误
                 info(f"查询任务失败: {e}")
@@ -158,56 +248,83 @@ class DoubaoASRClient:
             
             last_json = j
 
-            # 检查任务是否完成或失败
-            result = j.get("result")
-            
-            # 优先检查是否有 utterances（表示任务完成）
-            if isinstance(result, dict) and result.get("utterances"):
-                info(f"任务完成！共查询 {poll_count} 次")
+            if self._is_finished(j):
+                info("任务完成！共查询 %d 次", poll_count)
                 return j
-            
-            # Some versions return a list at top-level "result"
-            if isinstance(result, list) and len(result) > 0:
-                for item in result:
-                    if isinstance(item, dict) and item.get("utterances"):
-                        info(f"任务完成！共查询 {poll_count} 次")
-                        return j
-            
-            # 检查任务是否失败（只检查明确的错误状态）
-            # 正常状态：processing, pending, success, completed, done
-            # 错误状态：failed, error, timeout, cancelled 等
-            error_statuses = ("failed", "error", "timeout", "cancelled", "rejected")
-            
-            if isinstance(result, dict):
-                result_status = result.get("status", "").lower() if result.get("status") else ""
-                if result_status in error_statuses:
-                    error_msg = result.get("message") or result.get("error") or f"任务状态: {result_status}"
-                    raise RuntimeError(f"任务失败: {error_msg}, 响应: {j}")
-            
-            if isinstance(result, list):
-                for item in result:
-                    if isinstance(item, dict):
-                        item_status = item.get("status", "").lower() if item.get("status") else ""
-                        if item_status in error_statuses:
-                            error_msg = item.get("message") or item.get("error") or f"任务状态: {item_status}"
-                            raise RuntimeError(f"任务失败: {error_msg}, 响应: {j}")
-            
-            # 检查顶层状态字段
-            top_status = (j.get("status") or "").lower() if j.get("status") else ""
-            if top_status in error_statuses:
-                error_msg = j.get("message") or j.get("error") or f"任务状态: {top_status}"
-                raise RuntimeError(f"任务失败: {error_msg}, 响应: {j}")
-            
-            # 输出当前状态（如果有）
+
+            # 状态变化时才输出，长任务不再每次轮询都刷日志
+            result = j.get("result")
             status_display = j.get("status") or (result.get("status") if isinstance(result, dict) else None)
-            if status_display:
-                info(f"任务状态: {status_display}")
+            if status_display and status_display != last_status:
+                info("任务状态: %s（第 %d 次查询，已等待 %.0f 秒）", status_display, poll_count, time.monotonic() - start)
+            last_status = status_display
 
-            time.sleep(poll_interval_s)
+            # 最后一次等待不越过 deadline
+            time.sleep(max(0.0, min(delay + random.uniform(0, 0.25 * delay), deadline - time.monotonic())))
+            delay = min(max_poll_interval_s, delay * 1.5)
 
         raise TimeoutError(
             f"ASR polling timed out after {max_wait_s}s. Last response keys={list((last_json or {}).keys())}")
 
+    def poll_many(
+            self,
+            request_ids: list[str],
+            *,
+            resource_id: str,
+            poll_interval_s: float = 2.0,
+            max_poll_interval_s: float = 15.0,
+            max_wait_s: int = 3600,
+            max_workers: int = 8,
+    ) -> dict[str, Any]:
+        """
+        在同一个轮询循环里等待多个已提交的任务。
+
+        每轮用线程池并发查询所有未完成任务，只 sleep 一次；完成的任务记录其
+        /query 响应，失败/超时的任务记录对应异常。返回 {request_id: 响应或异常}。
+        """
+        pending = list(dict.fromkeys(request_ids))
+        headers = {rid: self._headers(resource_id, rid) for rid in pending}
+        results: dict[str, Any] = {}
+        # 网络层错误（连接断开/超时等）视为暂时性：任务留在 pending 下一轮重试，
+        # 只记下最近一次错误，超时时附在 TimeoutError 里
+        net_errors: dict[str, requests.RequestException] = {}
+
+        def _poll(rid: str) -> Any:
+            try:
+                j = self._query(headers[rid])
+                return j if self._is_finished(j) else None
+            except RuntimeError as e:
+                return e
+            except requests.RequestException as e:
+                net_errors[rid] = e
+                return None
+
+        deadline = time.monotonic() + max_wait_s
+        delay = poll_interval_s
+        last_counts = None
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending) or 1))) as executor:
+            while pending and time.monotonic() < deadline:
+                for rid, outcome in zip(pending, list(executor.map(_poll, pending))):
+                    if outcome is not None:
+                        results[rid] = outcome
+                pending = [rid for rid in pending if rid not in results]
+                # 完成/剩余数变化时才输出
+                counts = (len(results), len(pending))
+                if counts != last_counts:
+                    info("批量轮询：完成 %d 个，剩余 %d 个", *counts)
+                    last_counts = counts
+                if not pending:
+                    break
+                time.sleep(max(0.0, min(delay + random.uniform(0, 0.25 * delay), deadline - time.monotonic())))
+                delay = min(max_poll_interval_s, delay * 1.5)
+
+        for rid in pending:
+            msg = f"ASR polling timed out after {max_wait_s}s (request_id={rid})"
+            if rid in net_errors:
+                msg += f"; last error: {net_errors[rid]}"
+            results[rid] = TimeoutError(msg)
+        return results
+
 
 def guess_audio_format(url_or_path: str) -> str:
     """从 URL 或路径猜测音频格式"""
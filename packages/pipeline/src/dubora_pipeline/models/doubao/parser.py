@@ -14,6 +14,7 @@ Doubao ASR 数据解析器
 注意：返回的 Utterance/Word 使用通用的类型定义（dubora_core.schema），
 不绑定到 doubao 特定的类型，以便支持多 provider。
 """
+from sys import intern
 from typing import Any, Dict, List, Optional
 
 # 使用通用的类型定义（不绑定到 doubao）
@@ -37,13 +38,16 @@ def parse_words(word_list: List[Dict[str, Any]], default_speaker: str = "") -> L
     for w in word_list:
         st = int(w.get("start_time", 0))
         et = int(w.get("end_time", st))
-        txt = str(w.get("text", "")).strip()
+        txt = w.get("text", "")
+        if not isinstance(txt, str):
+            txt = str(txt)
+        txt = txt.strip()
         if not txt:
             continue
         
         # 尝试从 word 级别获取 speaker，否则使用默认值
         w_additions = w.get("additions") or {}
-        w_spk = str(w_additions.get("speaker", default_speaker))
+        w_spk = intern(str(w_additions.get("speaker", default_speaker)))
         
         words.append(Word(start_ms=st, end_ms=et, text=txt, speaker=w_spk))
     
@@ -69,10 +73,12 @@ def parse_utterances(raw: Dict[str, Any]) -> List[Utterance]:
     out: List[Utterance] = []
     for u in uts:
         additions = u.get("additions") or {}
-        spk = str(additions.get("speaker", "0"))
+        # speaker/emotion/gender 取值很少，驻留后逐词/逐句共享同一对象，比较走指针快路径
+        spk = intern(str(additions.get("speaker", "0")))
         st = int(u.get("start_time", 0))
         et = int(u.get("end_time", st))
-        text = normalize_text(str(u.get("text", "")))
+        text = u.get("text", "")
+        text = normalize_text(text if isinstance(text, str) else str(text))
         if not text:
             continue
         
@@ -92,8 +98,8 @@ def parse_utterances(raw: Dict[str, Any]) -> List[Utterance]:
             end_ms=et,
             text=text,
             words=words,
-            emotion=str(emotion) if emotion is not None else None,
-            gender=str(gender) if gender is not None else None,
+            emotion=intern(str(emotion)) if emotion is not None else None,
+            gender=intern(str(gender)) if gender is not None else None,
         ))
     # ensure time order
     out.sort(key=lambda x: (x.start_ms, x.end_ms))
@@ -13,7 +13,7 @@ from __future__ import annotations
 from dataclasses import replace
 from typing import Any, Callable, Dict, List, Optional
 
-from .request_types import RequestConfig, CorpusConfig
+from .request_types import AudioConfig, RequestConfig, CorpusConfig
 
 
 def _corpus(
@@ -32,51 +32,51 @@ def _corpus(
     return CorpusConfig.from_hotwords(hotwords if hotwords else [])
 
 
-def _base_request_cfg(
-    *,
-    hotwords: Optional[List[str]] = None,
-    scene_description: Optional[str] = None,
-) -> RequestConfig:
-    """
-    统一基线：你不想每个 preset 都重复写的默认项都在这里。
-    """
-    return RequestConfig(
-        model_name="bigmodel",  # 固定使用豆包 ASR 大模型
-        enable_itn=False,  # 数字/金额规范化（不影响切分）
-        enable_punc=True,  # 自动标点（只影响文本）
-        enable_ddc=False,  # 语义顺滑会吞短句，必须关
-        enable_speaker_info=True,  # 启用说话人分离
-        enable_channel_split=False,  # 非物理双声道不要开
-        show_utterances=True,  # 输出时间轴/分句/词（核心）
-        enable_gender_detection=True,  # 性别信息（辅助 speaker）
-        enable_emotion_detection=True,  # 情绪信息（辅助判断）
-        enable_lid=True,  # 启用语种识别，则会在 additions 使用 lid_lang 标记，包含唱歌识别
-        corpus=_corpus(hotwords=hotwords, scene_description=scene_description)
-    )
+# 统一基线：你不想每个 preset 都重复写的默认项都在这里。
+# RequestConfig 是 frozen dataclass，import 时构建一次即可共享；每次调用只替换 corpus。
+_BASE_REQUEST_CFG = RequestConfig(
+    model_name="bigmodel",  # 固定使用豆包 ASR 大模型
+    enable_itn=False,  # 数字/金额规范化（不影响切分）
+    enable_punc=True,  # 自动标点（只影响文本）
+    enable_ddc=False,  # 语义顺滑会吞短句，必须关
+    enable_speaker_info=True,  # 启用说话人分离
+    enable_channel_split=False,  # 非物理双声道不要开
+    show_utterances=True,  # 输出时间轴/分句/词（核心）
+    enable_gender_detection=True,  # 性别信息（辅助 speaker）
+    enable_emotion_detection=True,  # 情绪信息（辅助判断）
+    enable_lid=True,  # 启用语种识别，则会在 additions 使用 lid_lang 标记，包含唱歌识别
+)
+
+_VAD_SPK_CFG = replace(_BASE_REQUEST_CFG, vad_segment=True, end_window_size=800)
+_VAD_SPK_SMOOTH_CFG = replace(_BASE_REQUEST_CFG, vad_segment=True, end_window_size=1000)
+_SPK_SEMANTIC_CFG = replace(_BASE_REQUEST_CFG, vad_segment=False, end_window_size=None)
+
+# preset 基线在 import 时按 RequestConfig 规则（VAD 窗口范围、speaker 约束等）校验一次：
+# 配置写错直接导入失败，而不是等到提交 ASR 任务时才发现
+for _cfg in (_VAD_SPK_CFG, _VAD_SPK_SMOOTH_CFG, _SPK_SEMANTIC_CFG):
+    _cfg.validate(AudioConfig(url="", format="wav"))
+del _cfg
 
 
 def asr_vad_spk(
     *, hotwords: Optional[List[str]] = None, scene_description: Optional[str] = None,
 ) -> RequestConfig:
     """asr_vad_spk 预设（生产基线）：VAD 分句，end_window_size=800ms。"""
-    base = _base_request_cfg(hotwords=hotwords, scene_description=scene_description)
-    return replace(base, vad_segment=True, end_window_size=800)
+    return replace(_VAD_SPK_CFG, corpus=_corpus(hotwords=hotwords, scene_description=scene_description))
 
 
 def asr_vad_spk_smooth(
     *, hotwords: Optional[List[str]] = None, scene_description: Optional[str] = None,
 ) -> RequestConfig:
     """asr_vad_spk_smooth 预设（稳态参考）：VAD 分句，end_window_size=1000ms。"""
-    base = _base_request_cfg(hotwords=hotwords, scene_description=scene_description)
-    return replace(base, vad_segment=True, end_window_size=1000)
+    return replace(_VAD_SPK_SMOOTH_CFG, corpus=_corpus(hotwords=hotwords, scene_description=scene_description))
 
 
 def asr_spk_semantic(
     *, hotwords: Optional[List[str]] = None, scene_description: Optional[str] = None,
 ) -> RequestConfig:
     """asr_spk_semantic 预设：不走 VAD，让模型语义切分。"""
-    base = _base_request_cfg(hotwords=hotwords, scene_description=scene_description)
-    return replace(base, vad_segment=False, end_window_size=None)
+    return replace(_SPK_SEMANTIC_CFG, corpus=_corpus(hotwords=hotwords, scene_description=scene_description))
 
 
 PRESETS: Dict[str, Callable[..., RequestConfig]] = {
@@ -123,10 +123,9 @@ def get_presets() -> Dict[str, Dict[str, Any]]:
     Returns:
         预设名称到配置字典的映射
     """
-    from dataclasses import asdict
-    from .request_types import _remove_none
+    from .request_types import _to_dict
 
     return {
-        name: _remove_none(asdict(factory()))
+        name: _to_dict(factory())
         for name, factory in PRESETS.items()
     }
@@ -6,7 +6,7 @@
 """
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from typing import Any, Dict, List, Literal, Optional
 import json
 
@@ -23,12 +23,24 @@ AudioCodec = Literal["raw", "opus"]
 # Helper functions
 # ----------------------------
 
-def _remove_none(obj: Any) -> Any:
-    """递归移除 None；保留 False/0/""。"""
+def _to_dict(obj: Any) -> Any:
+    """dataclass → dict，递归移除 None；保留 False/0/""。
+
+    直接按字段遍历一次完成，不走 asdict 的递归 deepcopy + 二次过滤。
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        out = {}
+        for f in fields(obj):
+            v = getattr(obj, f.name)
+            if v is not None:
+                out[f.name] = _to_dict(v)
+        return out
     if isinstance(obj, dict):
-        return {k: _remove_none(v) for k, v in obj.items() if v is not None}
+        return {k: _to_dict(v) for k, v in obj.items() if v is not None}
     if isinstance(obj, list):
-        return [_remove_none(v) for v in obj if v is not None]
+        return [_to_dict(v) for v in obj if v is not None]
+    if isinstance(obj, tuple):
+        return tuple(_to_dict(v) for v in obj)
     return obj
 
 
@@ -219,4 +231,4 @@ class DoubaoASRRequest:
             字典格式的请求数据
         """
         self.validate()
-        return _remove_none(asdict(self))
+        return _to_dict(self)
@@ -18,6 +18,9 @@ except ImportError:
 
 from dubora_core.utils.logger import info, warning, error
 
+# 4xx 中仍值得重试的状态码（请求超时 / 限流）
+_RETRYABLE_CLIENT_CODES = frozenset({408, 429})
+
 
 def get_gemini_api_key() -> Optional[str]:
     """
@@ -186,9 +189,11 @@ def call_gemini_with_retry(
         except Exception as e:
             error_detail = str(e)
             
-            # 检查是否是 model not found 错误（不应该重试）
-            if "not found" in error_detail.lower() or "not supported" in error_detail.lower():
-                error(f"Model '{model_name}' not found or not supported: {error_detail}")
+            # google-genai 的 APIError 带 HTTP 状态码（e.code）：4xx（除 408/429）是模型不存在/
+            # 不支持/参数错误等配置问题，重试不会成功，直接按结构化字段判断，不解析错误文本
+            code = getattr(e, "code", None)
+            if isinstance(code, int) and 400 <= code < 500 and code not in _RETRYABLE_CLIENT_CODES:
+                error(f"Model '{model_name}' request rejected (HTTP {code}): {error_detail}")
                 error("This is a configuration error, not retrying.")
                 return None
             
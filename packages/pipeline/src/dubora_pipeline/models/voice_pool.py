@@ -5,6 +5,11 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # 默认声线池（8 条 en-US 声线）
 DEFAULT_VOICE_POOL = {
@@ -70,6 +75,35 @@ DEFAULT_VOICE_POOL = {
 }
 
 
+# 解析结果缓存：path → (st_mtime_ns, st_size, pool_data)。文件不变时多集批跑只解析一次。
+_POOL_CACHE: dict[str, tuple] = {}
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    """读取 JSON：装了 orjson 走 C 解码，否则退回标准库。"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_pool(path: Path) -> dict[str, Any]:
+    """按 (mtime_ns, size) 命中缓存；返回的 dict 为共享只读对象。"""
+    st = path.stat()
+    key = str(path)
+    cached = _POOL_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = _load_json(path)
+    _POOL_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def clear_voice_pool_cache() -> None:
+    """清空声线池解析缓存（测试用）。"""
+    _POOL_CACHE.clear()
+
+
 class VoicePool:
     """声线池管理器。"""
     
@@ -81,8 +115,7 @@ class VoicePool:
             pool_path: 声线池 JSON 文件路径（None = 使用默认）
         """
         if pool_path and Path(pool_path).exists():
-            with open(pool_path, "r", encoding="utf-8") as f:
-                self.pool_data = json.load(f)
+            self.pool_data = _load_pool(Path(pool_path))
         else:
             self.pool_data = DEFAULT_VOICE_POOL
     
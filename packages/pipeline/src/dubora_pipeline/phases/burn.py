@@ -80,16 +80,21 @@ class BurnPhase(Phase):
         en_segments = []
         zh_segments = []
         for cue in all_cues:
-            start = cue["start_ms"] / 1000.0
-            end = cue["end_ms"] / 1000.0
+            start_ms = cue["start_ms"]
+            end_ms = cue["end_ms"]
+            start = start_ms / 1000.0
+            end = end_ms / 1000.0
             text_en = (cue.get("text_en") or "").strip()
             text_cn = (cue.get("text") or "").strip()
+            # 带上整数毫秒，SRT 时间戳直接按 ms 格式化（en/zh 共用同一份缓存）
             if text_en:
                 if cue.get("kind") == "sing":
                     text_en = f"\u266a{text_en}\u266a"
-                en_segments.append({"start": start, "end": end, "en_text": text_en})
+                en_segments.append({"start": start, "end": end, "start_ms": start_ms, "end_ms": end_ms,
+                                    "en_text": text_en})
             if text_cn:
-                zh_segments.append({"start": start, "end": end, "zh_text": text_cn})
+                zh_segments.append({"start": start, "end": end, "start_ms": start_ms, "end_ms": end_ms,
+                                    "zh_text": text_cn})
 
         en_segments.sort(key=lambda x: x["start"])
         zh_segments.sort(key=lambda x: x["start"])
@@ -16,27 +16,13 @@ from pathlib import Path
 from typing import Dict
 
 from dubora_pipeline.phase import Phase
+from dubora_pipeline.utils.audio import probe_duration_ms
 from dubora_pipeline.types import Artifact, ErrorInfo, PhaseResult, RunContext, ResolvedOutputs
 from dubora_pipeline.processors.mix import run_timeline as mix_run_timeline
 from dubora_pipeline.schema.dub_manifest import dub_manifest_from_utterances
 from dubora_core.utils.logger import info, warning
 
 
-def _probe_duration_ms(audio_path: str) -> int:
-    """Probe audio duration using ffprobe."""
-    result = subprocess.run(
-        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-         "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"ffprobe failed: {result.stderr}")
-    duration_str = result.stdout.strip()
-    if duration_str == "N/A" or not duration_str:
-        raise RuntimeError(f"ffprobe returned invalid duration for {audio_path}")
-    return int(float(duration_str) * 1000)
-
-
 class MixPhase(Phase):
     """混音 Phase (Timeline-First Architecture)。"""
 
@@ -87,7 +73,7 @@ class MixPhase(Phase):
             audio_path = workspace_path / audio_artifact.relpath
             if audio_path.exists():
                 try:
-                    audio_duration_ms = _probe_duration_ms(str(audio_path))
+                    audio_duration_ms = probe_duration_ms(str(audio_path))
                     info(f"Probed audio duration: {audio_duration_ms}ms")
                 except RuntimeError as e:
                     warning(f"Could not probe audio duration: {e}")
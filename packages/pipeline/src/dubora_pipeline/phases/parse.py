@@ -17,6 +17,11 @@ from dubora_pipeline.processors.asr.postprocess import (
 from dubora_core.config import resolve_emotion
 from dubora_core.utils.logger import info
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ParsePhase(Phase):
     """ASR doubao 结果 → cue rows。"""
@@ -39,10 +44,7 @@ class ParsePhase(Phase):
         doubao_path = Path(ctx.workspace) / inputs["asr.doubao"].relpath
 
         try:
-            with open(doubao_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-
-            segments = get_doubao_utterances(raw)
+            segments = _load_utterances(doubao_path)
             if not segments:
                 return PhaseResult(
                     status="failed",
@@ -65,6 +67,21 @@ class ParsePhase(Phase):
             )
 
 
+def _load_utterances(path: Path) -> list[dict]:
+    """读 asr-doubao.json 并只保留 utterances 的精简字段。
+
+    原始结果里逐字 words 时间戳占了绝大部分体积；解析树只活在本函数内，
+    返回后即可回收，后续 cue 构建阶段的峰值内存只剩 O(segments)。
+    装了 orjson 时直接从 bytes 解码，省掉一次整文件 str 解码。
+    """
+    if orjson is not None:
+        raw = orjson.loads(path.read_bytes())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    return get_doubao_utterances(raw)
+
+
 _TRAILING_PUNC = "，。,.、；：;:"
 
 
@@ -74,17 +91,21 @@ def _finalize_cues(
     asr_dir: Path,
     extra_metrics: dict | None = None,
 ) -> PhaseResult:
-    """构建 cue rows + 写文件 + 写 DB。"""
+    """构建 cue rows + 写文件 + 写 DB。
+
+    segments 来自 get_doubao_utterances（已归一化为 int 时间戳 + str speaker），
+    这里直接取字段，不再逐条做 int()/str() 强转。
+    """
     cue_rows = []
     for u in segments:
-        text = str(u.get("text", "")).strip().rstrip(_TRAILING_PUNC)
+        text = u["text"].strip().rstrip(_TRAILING_PUNC)
         if not text:
             continue
         cue_rows.append({
-            "start_ms": int(u.get("start_ms", 0)),
-            "end_ms": int(u.get("end_ms", 0)),
+            "start_ms": u["start_ms"],
+            "end_ms": u["end_ms"],
             "text": text,
-            "speaker": str(u.get("speaker", "0")),
+            "speaker": u["speaker"],
             "emotion": resolve_emotion(u.get("emotion") or "neutral"),
             "kind": u.get("type", "speech"),
             "gender": u.get("gender"),
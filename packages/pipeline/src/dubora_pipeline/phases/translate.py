@@ -15,11 +15,13 @@ Translate Phase: 增量翻译（utterance 级增量, per-cue 回填）
 - 脏行为空 → 直接成功（no-op）
 """
 import re
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from dubora_pipeline.phase import Phase
+from dubora_pipeline.utils.audio import probe_duration_ms
 from dubora_core.store import _compute_source_hash
 from dubora_pipeline.types import Artifact, ErrorInfo, PhaseResult, RunContext, ResolvedOutputs
 from dubora_pipeline.processors.mt.utterance_translate import (
@@ -34,6 +36,49 @@ from dubora_pipeline.processors.mt.name_map_complete import complete_names_with_
 from dubora_core.utils.logger import info, error, warning
 
 
+class _WriteGate:
+    """单次 run 内的写入闸：串行化 DB / dict_loader 写入；出现失败后拒绝后续 cue 写入。"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stopped = False
+
+
+def _translate_concurrently(
+    work: list[tuple[dict, list]],
+    translate_one: Callable[[tuple[dict, list]], Optional[bool]],
+    finalize: Callable[[dict, bool], None],
+    gate: _WriteGate,
+    max_workers: int,
+) -> Optional[tuple[dict, BaseException]]:
+    """并发翻译 work 中的 (utt, cues)，每个 utterance 完成后立即 finalize。
+
+    首个失败出现后停止：取消尚未开始的任务，gate 拒绝进行中任务的 cue 写入
+    （translate_one 返回 None）；失败前已写完 cue 的照常 finalize，不留下
+    有 text_en 却无 source_hash 的 utterance。返回首个失败 (utt, exc)，全部成功返回 None。
+    """
+    failure = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(translate_one, item): item[0] for item in work}
+        for fut in as_completed(futures):
+            if fut.cancelled():
+                continue
+            utt = futures[fut]
+            exc = fut.exception()
+            if exc is not None:
+                if failure is None:
+                    failure = (utt, exc)
+                    with gate.lock:
+                        gate.stopped = True
+                    for f in futures:
+                        f.cancel()
+                continue
+            translated = fut.result()
+            if translated is not None:
+                finalize(utt, translated)
+    return failure
+
+
 def _build_name_variants(en_name: str, src_name: str) -> List[str]:
     """Build common mistranslation variants for name replacement."""
     variants = []
@@ -47,21 +92,6 @@ def _build_name_variants(en_name: str, src_name: str) -> List[str]:
     return variants
 
 
-def _probe_duration_ms(audio_path: str) -> int:
-    """Probe audio duration using ffprobe."""
-    result = subprocess.run(
-        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-         "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"ffprobe failed: {result.stderr}")
-    duration_str = result.stdout.strip()
-    if duration_str == "N/A" or not duration_str:
-        raise RuntimeError(f"ffprobe returned invalid duration for {audio_path}")
-    return int(float(duration_str) * 1000)
-
-
 def _parse_numbered_output(text: str, expected_count: int) -> list[str]:
     """Parse numbered output like [1] text1\\n[2] text2...
 
@@ -141,7 +171,7 @@ class TranslatePhase(Phase):
             audio_path = workspace_path / audio_artifact.relpath
             if audio_path.exists():
                 try:
-                    audio_duration_ms = _probe_duration_ms(str(audio_path))
+                    audio_duration_ms = probe_duration_ms(str(audio_path))
                     info(f"Probed audio duration: {audio_duration_ms}ms")
                 except RuntimeError as e:
                     warning(f"Could not probe audio duration: {e}")
@@ -193,57 +223,73 @@ class TranslatePhase(Phase):
         ok_count = 0
         fail_count = 0
 
-        # Get all utterances for gap calculation
+        # Get all utterances for gap calculation: utt id → 下一句 start_ms（一次建好，O(1) 查询）
         sorted_utts = sorted(all_utts, key=lambda u: u.get("start_ms", 0))
+        next_start_ms = {
+            u["id"]: nxt["start_ms"] for u, nxt in zip(sorted_utts, sorted_utts[1:])
+        }
 
+        work = []
         for utt in dirty_utts:
             # Get sub-cues for this utterance via junction table
             cues = store.get_cues_for_utterance(utt["id"])
             if not cues:
                 continue
 
-            source_text = "".join(c.get("text", "").strip() for c in cues)
+            source_text = "".join([c.get("text", "").strip() for c in cues])
             if not source_text:
                 continue
+            work.append((utt, cues))
 
-            try:
-                # Translate and write per-cue text_en
-                translated = self._translate_and_write_cues(
-                    utt, cues, store,
-                    translate_fn, is_gemini, dict_loader,
-                    name_guard, episode_context, story_background,
-                )
-            except Exception as e:
-                error(f"Translation failed for utterance {utt['id']}: {e}")
-                return PhaseResult(
-                    status="failed",
-                    error=ErrorInfo(type=type(e).__name__, message=str(e)),
-                )
-
-            # Calculate tts_policy (utterance-level gap)
-            tts_policy = self._calc_tts_policy(utt, sorted_utts, audio_duration_ms, ctx)
+        gate = _WriteGate()
 
-            # Re-read cues to get updated text_en, build utterance cache
-            cues_after = store.get_cues_for_utterance(utt["id"])
-            text_en_cache = " ".join(
-                c.get("text_en", "").strip() for c in cues_after
-                if c.get("text_en", "").strip()
-            )
-            current_hash = _compute_source_hash(cues_after)
-
-            # Update utterance: text_en cache + source_hash + tts_policy
-            store.update_utterance(
-                utt["id"],
-                text_en=text_en_cache,
-                source_hash=current_hash,
-                tts_policy=tts_policy,
+        def _translate_one(item):
+            utt, cues = item
+            # Translate and write per-cue text_en
+            return self._translate_and_write_cues(
+                utt, cues, store,
+                translate_fn, is_gemini, dict_loader,
+                name_guard, episode_context, story_background, gate,
             )
 
+        def _finalize(utt: dict, translated: bool) -> None:
+            nonlocal ok_count, fail_count
+            # Calculate tts_policy (utterance-level gap)
+            tts_policy = self._calc_tts_policy(utt, next_start_ms, audio_duration_ms, ctx)
+
+            with gate.lock:
+                # Re-read cues to get updated text_en, build utterance cache
+                cues_after = store.get_cues_for_utterance(utt["id"])
+                en_parts = [c.get("text_en", "").strip() for c in cues_after]
+                text_en_cache = " ".join([t for t in en_parts if t])
+                current_hash = _compute_source_hash(cues_after)
+
+                # Update utterance: text_en cache + source_hash + tts_policy
+                store.update_utterance(
+                    utt["id"],
+                    text_en=text_en_cache,
+                    source_hash=current_hash,
+                    tts_policy=tts_policy,
+                )
+
             if translated:
                 ok_count += 1
             else:
                 fail_count += 1
 
+        # LLM 调用是 RTT 主导：各 utterance 并发翻译，完成一个收尾一个
+        phase_config = ctx.config.get("phases", {}).get("translate",
+                       ctx.config.get("phases", {}).get("mt", {}))
+        max_workers = max(1, int(phase_config.get("max_workers", 4)))
+        failure = _translate_concurrently(work, _translate_one, _finalize, gate, max_workers)
+        if failure is not None:
+            utt, e = failure
+            error(f"Translation failed for utterance {utt['id']}: {e}")
+            return PhaseResult(
+                status="failed",
+                error=ErrorInfo(type=type(e).__name__, message=str(e)),
+            )
+
         info(f"Translation complete: {ok_count} ok, {fail_count} empty")
 
         # Reload for metrics
@@ -336,34 +382,38 @@ class TranslatePhase(Phase):
     def _translate_and_write_cues(
         self, utt: dict, cues: list[dict], store,
         translate_fn, is_gemini: bool, dict_loader, name_guard,
-        episode_context: str, story_background: str,
-    ) -> bool:
+        episode_context: str, story_background: str, gate: _WriteGate,
+    ) -> Optional[bool]:
         """Translate an utterance and write per-cue text_en.
 
         Single-cue: direct translation (existing flow).
         Multi-cue: numbered format → LLM returns per-cue translations.
 
-        Returns True if any translation produced non-empty text.
+        Returns True if any translation produced non-empty text,
+        None if the gate was stopped and nothing was written.
         """
         if len(cues) == 1:
             # ── Single cue: direct translation ──
             en_text = self._translate_single(
                 cues[0]["text"], utt, translate_fn, is_gemini,
-                dict_loader, name_guard, episode_context, story_background,
+                dict_loader, name_guard, episode_context, story_background, gate,
             )
-            store.update_cue(cues[0]["id"], text_en=en_text)
+            with gate.lock:
+                if gate.stopped:
+                    return None
+                store.update_cue(cues[0]["id"], text_en=en_text)
             return bool(en_text.strip())
 
         # ── Multi-cue: per-cue numbered translation ──
         return self._translate_multi_cue(
             utt, cues, store, translate_fn, is_gemini,
-            dict_loader, name_guard, episode_context, story_background,
+            dict_loader, name_guard, episode_context, story_background, gate,
         )
 
     def _translate_single(
         self, zh_text: str, utt: dict,
         translate_fn, is_gemini: bool, dict_loader, name_guard,
-        episode_context: str, story_background: str,
+        episode_context: str, story_background: str, gate: _WriteGate,
     ) -> str:
         """Translate a single text (existing flow)."""
         max_retries = 3
@@ -376,7 +426,7 @@ class TranslatePhase(Phase):
         if name_guard:
             zh_text, placeholder_to_name = name_guard.extract_and_replace_names(zh_text)
             if placeholder_to_name:
-                self._ensure_names_in_dict(placeholder_to_name, dict_loader, translate_fn, is_gemini)
+                self._ensure_names_in_dict(placeholder_to_name, dict_loader, translate_fn, is_gemini, gate)
                 for ph, src_name in placeholder_to_name.items():
                     annotated = f"<<{ph[2:-2]}:{src_name}>>"
                     zh_text = zh_text.replace(ph, annotated)
@@ -404,8 +454,8 @@ class TranslatePhase(Phase):
     def _translate_multi_cue(
         self, utt: dict, cues: list[dict], store,
         translate_fn, is_gemini: bool, dict_loader, name_guard,
-        episode_context: str, story_background: str,
-    ) -> bool:
+        episode_context: str, story_background: str, gate: _WriteGate,
+    ) -> Optional[bool]:
         """Translate a multi-cue utterance with per-cue numbered format.
 
         Builds numbered input like:
@@ -418,7 +468,8 @@ class TranslatePhase(Phase):
             [2] Didn't I tell you to go to school?
             [3] Why did you skip class?
 
-        Returns True if any translation produced non-empty text.
+        Returns True if any translation produced non-empty text,
+        None if the gate was stopped and nothing was written.
         """
         max_retries = 3
 
@@ -433,7 +484,7 @@ class TranslatePhase(Phase):
         if name_guard:
             marked_text, placeholder_to_name = name_guard.extract_and_replace_names(marked_text)
             if placeholder_to_name:
-                self._ensure_names_in_dict(placeholder_to_name, dict_loader, translate_fn, is_gemini)
+                self._ensure_names_in_dict(placeholder_to_name, dict_loader, translate_fn, is_gemini, gate)
                 for ph, src_name in placeholder_to_name.items():
                     annotated = f"<<{ph[2:-2]}:{src_name}>>"
                     marked_text = marked_text.replace(ph, annotated)
@@ -474,11 +525,14 @@ class TranslatePhase(Phase):
 
         # Write each cue's text_en
         any_translated = False
-        for i, cue in enumerate(cues):
-            en_text = per_cue_texts[i].strip()
-            store.update_cue(cue["id"], text_en=en_text)
-            if en_text:
-                any_translated = True
+        with gate.lock:
+            if gate.stopped:
+                return None
+            for i, cue in enumerate(cues):
+                en_text = per_cue_texts[i].strip()
+                store.update_cue(cue["id"], text_en=en_text)
+                if en_text:
+                    any_translated = True
 
         if any_translated:
             info(f"Multi-cue translation ({len(cues)} cues): "
@@ -488,19 +542,29 @@ class TranslatePhase(Phase):
 
     def _ensure_names_in_dict(
         self, placeholder_to_name: dict, dict_loader, translate_fn, is_gemini: bool,
+        gate: _WriteGate,
     ) -> None:
         """Ensure all names from placeholder_to_name exist in dict_loader."""
         all_src_names = set(placeholder_to_name.values())
-        missing = [n for n in all_src_names if not dict_loader.has_name(n)]
-        if missing:
-            llm_results = complete_names_with_llm(
-                missing_names=missing,
-                translate_fn=translate_fn,
-                is_gemini=is_gemini,
-            )
+        # 只有查/写字典持锁；LLM 补全在锁外，不让其他 worker 排队等一次 RTT
+        with gate.lock:
+            missing = [n for n in all_src_names if not dict_loader.has_name(n)]
+        if not missing:
+            return
+        llm_results = complete_names_with_llm(
+            missing_names=missing,
+            translate_fn=translate_fn,
+            is_gemini=is_gemini,
+        )
+        with gate.lock:
+            # 并发补全同一新名字时先写入者为准
+            added = False
             for src_name, result in llm_results.items():
-                dict_loader.add_name(src_name, result["target"])
-            dict_loader.save_names()
+                if not dict_loader.has_name(src_name):
+                    dict_loader.add_name(src_name, result["target"])
+                    added = True
+            if added:
+                dict_loader.save_names()
 
     def _post_process_translation(
         self, en_text: str, placeholder_to_name: dict, dict_loader,
@@ -542,10 +606,13 @@ class TranslatePhase(Phase):
         return en_text
 
     def _calc_tts_policy(
-        self, utt: dict, sorted_utts: list[dict],
+        self, utt: dict, next_start_ms: dict[int, int],
         audio_duration_ms: int, ctx: RunContext,
     ) -> dict:
-        """Calculate TTS policy for an utterance (max_rate + allow_extend_ms)."""
+        """Calculate TTS policy for an utterance (max_rate + allow_extend_ms).
+
+        next_start_ms: {utt_id: 下一句 start_ms}，最后一句不在其中。
+        """
         tts_config = ctx.config.get("phases", {}).get("tts", {})
         default_max_rate = float(tts_config.get("max_rate", 1.3))
         min_tts_window_ms = int(tts_config.get("min_tts_window_ms", 900))
@@ -556,10 +623,9 @@ class TranslatePhase(Phase):
 
         # Find gap to next utterance
         gap_to_next_ms = None
-        for i, u in enumerate(sorted_utts):
-            if u["id"] == utt["id"] and i + 1 < len(sorted_utts):
-                gap_to_next_ms = sorted_utts[i + 1]["start_ms"] - utt["end_ms"]
-                break
+        next_start = next_start_ms.get(utt["id"])
+        if next_start is not None:
+            gap_to_next_ms = next_start - utt["end_ms"]
 
         if gap_to_next_ms is not None and gap_to_next_ms > 0:
             allow_extend_ms = max(0, gap_to_next_ms - 60)
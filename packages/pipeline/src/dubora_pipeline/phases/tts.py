@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Dict
 
 from dubora_pipeline.phase import Phase
+from dubora_pipeline.utils.audio import probe_duration_ms
 from dubora_core.store import DbStore, _compute_voice_hash
 from dubora_core.manifest import resolve_artifact_path
 from dubora_pipeline.types import Artifact, ErrorInfo, PhaseResult, RunContext, ResolvedOutputs
@@ -28,19 +29,8 @@ from dubora_pipeline.schema.tts_report import tts_report_to_dict
 from dubora_core.utils.logger import info, warning
 
 
-def _probe_duration_ms(audio_path: str) -> int:
-    """Probe audio duration using ffprobe."""
-    result = subprocess.run(
-        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-         "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"ffprobe failed: {result.stderr}")
-    duration_str = result.stdout.strip()
-    if duration_str == "N/A" or not duration_str:
-        raise RuntimeError(f"ffprobe returned invalid duration for {audio_path}")
-    return int(float(duration_str) * 1000)
+# 增量 no-op 时的 metrics 模板（返回时浅拷贝，避免调用方修改共享对象）
+_NOOP_METRICS = {"total_segments": 0, "success_count": 0, "failed_count": 0, "incremental": True}
 
 
 class TTSPhase(Phase):
@@ -84,7 +74,7 @@ class TTSPhase(Phase):
             audio_path = workspace_path / audio_artifact.relpath
             if audio_path.exists():
                 try:
-                    audio_duration_ms = _probe_duration_ms(str(audio_path))
+                    audio_duration_ms = probe_duration_ms(str(audio_path))
                     info(f"Probed audio duration: {audio_duration_ms}ms")
                 except RuntimeError as e:
                     warning(f"Could not probe audio duration: {e}")
@@ -189,7 +179,7 @@ class TTSPhase(Phase):
                 return PhaseResult(
                     status="succeeded",
                     outputs=["tts.segments_dir"],
-                    metrics={"total_segments": 0, "success_count": 0, "failed_count": 0, "incremental": True},
+                    metrics=dict(_NOOP_METRICS),
                 )
 
             # Build DubManifest from dirty utterances only
@@ -202,7 +192,7 @@ class TTSPhase(Phase):
                 return PhaseResult(
                     status="succeeded",
                     outputs=["tts.segments_dir"],
-                    metrics={"total_segments": 0, "success_count": 0, "failed_count": 0, "incremental": True},
+                    metrics=dict(_NOOP_METRICS),
                 )
 
             # Fish 克隆参考音频：per-episode + per-role 截取（sample 不跨集复用）
@@ -266,15 +256,16 @@ class TTSPhase(Phase):
             # Generate segments.json index
             from dubora_pipeline.fingerprints import hash_file
             segments_index = {}
+            # utt_id → role key，只遍历一次 manifest（避免每个 segment 线性查找）
+            role_key_by_utt = {
+                u.utt_id: str(u.role_id)
+                for u in dub_manifest.utterances if u.role_id is not None
+            }
             for seg in tts_report.segments:
                 if seg.error:
                     continue
                 seg_file = segments_dir / seg.output_path
-                role_key = next(
-                    (str(u.role_id) for u in dub_manifest.utterances
-                     if u.utt_id == seg.utt_id and u.role_id is not None),
-                    "",
-                )
+                role_key = role_key_by_utt.get(seg.utt_id, "")
                 spk_info = voice_assignment.get("speakers", {}).get(role_key, {})
                 segments_index[seg.utt_id] = {
                     "wav_path": seg.output_path,
@@ -328,7 +319,7 @@ class TTSPhase(Phase):
                     if item.is_file():
                         item.unlink(missing_ok=True)
 
-            info(f"TTS synthesis completed: {tts_report.success_count}/{tts_report.total_segments} segments")
+            info(f"TTS synthesis completed: {result.metrics['success_count']}/{result.metrics['total_segments']} segments")
 
             # Drift score check
             drift_warnings = []
@@ -352,9 +343,7 @@ class TTSPhase(Phase):
                 status="succeeded",
                 outputs=["tts.segments_dir"],
                 metrics={
-                    "total_segments": tts_report.total_segments,
-                    "success_count": tts_report.success_count,
-                    "failed_count": tts_report.failed_count,
+                    **result.metrics,
                     "audio_duration_ms": full_manifest.audio_duration_ms,
                     "drift_warnings": len(drift_warnings),
                 },
@@ -491,7 +480,7 @@ class TTSPhase(Phase):
                 vocals_cache[ep_num] = (None, 0)
                 return None, 0
             try:
-                dur = _probe_duration_ms(str(vp))
+                dur = probe_duration_ms(str(vp))
             except RuntimeError as e:
                 warning(f"Could not probe vocals duration for ep {ep_num}: {e}")
                 vocals_cache[ep_num] = (None, 0)
@@ -2,13 +2,14 @@
 
 公共 API：
 - transcribe(): Doubao ASR 调用
+- transcribe_many(): 批量提交后统一轮询
 - get_doubao_utterances / fill_null_emotions / extend_end_ms: parse 后处理
 
 内部模块：
 - impl.py: Doubao ASR 实现
 - postprocess.py: Doubao 输出 → 统一 utt 结构 + emotion 回填 + end_ms 延长
 """
-from .impl import transcribe
+from .impl import transcribe, transcribe_many
 from .postprocess import get_doubao_utterances, fill_null_emotions, extend_end_ms
 
-__all__ = ["transcribe", "get_doubao_utterances", "fill_null_emotions", "extend_end_ms"]
+__all__ = ["transcribe", "transcribe_many", "get_doubao_utterances", "fill_null_emotions", "extend_end_ms"]
@@ -6,9 +6,13 @@ ASR 转录：调用 ASR 服务，返回 utterances
 - 输出：utterances（带时间轴 / speaker）
 - 不关心：srt、postprofile、文件系统
 """
+import hashlib
 import os
+import threading
 from typing import List, Optional, Tuple, Any, Dict
 
+import requests
+
 from dubora_pipeline.models.doubao import (
     DoubaoASRClient,
     guess_audio_format,
@@ -16,9 +20,68 @@ from dubora_pipeline.models.doubao import (
     parse_utterances,
 )
 from dubora_pipeline.schema import Utterance
-from dubora_pipeline.models.doubao.request_types import DoubaoASRRequest, AudioConfig, UserInfo
+from dubora_pipeline.models.doubao.request_types import DoubaoASRRequest, AudioConfig, RequestConfig, UserInfo
 from dubora_core.utils.logger import info
 
+# 复用 DoubaoASRClient（及其 requests.Session 连接池），key 为 (appid, token 摘要)，不直接缓存明文密钥
+_CLIENT_CACHE_MAX = 4
+_clients: dict[tuple[str, str], DoubaoASRClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(appid: str, access_token: str) -> DoubaoASRClient:
+    key = (appid, hashlib.sha256(access_token.encode("utf-8")).hexdigest()[:16])
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if len(_clients) >= _CLIENT_CACHE_MAX:
+                _clients.clear()
+            client = DoubaoASRClient(app_key=appid, access_key=access_token)
+            _clients[key] = client
+        return client
+
+
+_RESOURCE_ID = "volc.seedasr.auc"
+
+
+def _resolve_credentials(appid: Optional[str], access_token: Optional[str]) -> tuple[str, str]:
+    if appid is None:
+        appid = os.getenv("DOUBAO_APPID")
+    if access_token is None:
+        access_token = os.getenv("DOUBAO_ACCESS_TOKEN")
+
+    if not appid or not access_token:
+        raise ValueError(
+            "DOUBAO_APPID 和 DOUBAO_ACCESS_TOKEN 必须设置。"
+            "请通过参数提供或设置环境变量"
+        )
+    return appid, access_token
+
+
+def _build_request(
+        appid: str,
+        audio_url: str,
+        request_config: RequestConfig,
+        audio_format: Optional[str],
+        language: str,
+) -> DoubaoASRRequest:
+    # 猜测音频格式（如果未提供）
+    if audio_format is None:
+        audio_format = guess_audio_format(audio_url)
+
+    return DoubaoASRRequest(
+        user=UserInfo(uid=str(appid)),
+        audio=AudioConfig(
+            url=audio_url,
+            format=audio_format,
+            language=language,
+            rate=16000,  # 固定 16kHz
+            bits=16,  # 固定 16-bit
+            channel=1,  # 固定单声道
+        ),
+        request=request_config,
+    )
+
 
 def transcribe(
         audio_url: str,
@@ -51,52 +114,80 @@ def transcribe(
     Raises:
         ValueError: 如果 appid 或 access_token 未设置
     """
-    # 获取配置
-    if appid is None:
-        appid = os.getenv("DOUBAO_APPID")
-    if access_token is None:
-        access_token = os.getenv("DOUBAO_ACCESS_TOKEN")
-
-    if not appid or not access_token:
-        raise ValueError(
-            "DOUBAO_APPID 和 DOUBAO_ACCESS_TOKEN 必须设置。"
-            "请通过参数提供或设置环境变量"
-        )
+    appid, access_token = _resolve_credentials(appid, access_token)
 
-    # 创建客户端
-    client = DoubaoASRClient(app_key=appid, access_key=access_token)
+    # 获取（复用）客户端
+    client = _get_client(appid, access_token)
 
     # 1. 获取预设配置
     request_config = get_preset(preset, hotwords=hotwords, scene_description=scene_description)
 
-    # 2. 猜测音频格式（如果未提供）
-    if audio_format is None:
-        audio_format = guess_audio_format(audio_url)
-
-    # 3. 构建完整请求
-    req = DoubaoASRRequest(
-        user=UserInfo(uid=str(appid)),
-        audio=AudioConfig(
-            url=audio_url,
-            format=audio_format,
-            language=language,
-            rate=16000,  # 固定 16kHz
-            bits=16,  # 固定 16-bit
-            channel=1,  # 固定单声道
-        ),
-        request=request_config,
-    )
+    # 2. 构建完整请求
+    req = _build_request(appid, audio_url, request_config, audio_format, language)
 
-    # 4. 调用 API
-    info(f"调用 ASR API (预设: {preset}, format: {audio_format})...")
+    # 3. 调用 API
+    info(f"调用 ASR API (预设: {preset}, format: {req.audio.format})...")
     raw_response = client.submit_and_poll(
         req=req,
-        resource_id="volc.seedasr.auc",
+        resource_id=_RESOURCE_ID,
         poll_interval_s=2.0,
         max_wait_s=3600,
     )
 
-    # 5. 解析结果
+    # 4. 解析结果
     utterances = parse_utterances(raw_response)
 
     return raw_response, utterances
+
+
+def transcribe_many(
+        audio_urls: list[str],
+        preset: str,
+        *,
+        appid: Optional[str] = None,
+        access_token: Optional[str] = None,
+        hotwords: Optional[list[str]] = None,
+        scene_description: Optional[str] = None,
+        audio_format: Optional[str] = None,
+        language: str = "zh-CN",
+) -> list[Any]:
+    """批量转写：先把所有音频都提交，再在一个轮询循环里等全部完成。
+
+    服务端并行处理所有任务，总耗时约等于最慢的单个任务，而不是逐个 submit+poll 的总和。
+    参数含义同 transcribe；audio_format 对所有输入生效（None 时逐条从 URL 猜测）。
+
+    Returns:
+        与 audio_urls 一一对应的列表，元素为 (raw_response, utterances)，
+        或该条提交/轮询失败时的异常对象
+    """
+    appid, access_token = _resolve_credentials(appid, access_token)
+    client = _get_client(appid, access_token)
+    request_config = get_preset(preset, hotwords=hotwords, scene_description=scene_description)
+
+    # 1. 全部提交
+    submitted: list[Any] = []
+    for audio_url in audio_urls:
+        try:
+            req = _build_request(appid, audio_url, request_config, audio_format, language)
+            submitted.append(client.submit(req, resource_id=_RESOURCE_ID))
+        except (RuntimeError, ValueError, requests.RequestException) as e:
+            # 单条构建/提交失败只记在该条结果里，不影响其余任务
+            submitted.append(e)
+    request_ids = [r for r in submitted if isinstance(r, str)]
+    info(f"已提交 {len(request_ids)}/{len(audio_urls)} 个 ASR 任务 (预设: {preset})，开始批量轮询...")
+
+    # 2. 单循环轮询所有任务
+    polled = client.poll_many(request_ids, resource_id=_RESOURCE_ID, poll_interval_s=2.0, max_wait_s=3600)
+
+    # 3. 按输入顺序解析
+    results: list[Any] = []
+    for r in submitted:
+        if isinstance(r, Exception):
+            results.append(r)
+            continue
+        raw_response = polled[r]
+        if isinstance(raw_response, Exception):
+            results.append(raw_response)
+        else:
+            results.append((raw_response, parse_utterances(raw_response)))
+    return results
@@ -2,26 +2,37 @@
 
 单源豆包方案下，parse phase 直接用这些工具把 doubao raw 转成 cue rows。
 """
+import sys
+from operator import itemgetter
+
 from dubora_core.utils.logger import info
 
 
+def _intern(value):
+    """speaker/emotion/gender 只有少量取值，驻留后整集共享同一对象。"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def get_doubao_utterances(data: dict) -> list[dict]:
     """提取 Doubao utterances → 统一格式。
 
+    时间戳统一转为 int 毫秒，speaker 统一转为 str，下游直接取字段即可。
     speaker 默认 "0"（豆包未识别说话人时的兜底，对应未分配 role 的物理声源 label）。
     """
-    utts = []
-    for u in data["result"]["utterances"]:
-        adds = u.get("additions", {})
-        utts.append({
-            "start_ms": u["start_time"],
-            "end_ms": u["end_time"],
+    utts = [
+        {
+            "start_ms": int(u["start_time"]),
+            "end_ms": int(u["end_time"]),
             "text": u["text"],
-            "speaker": str(adds.get("speaker", "0")),
-            "emotion": adds.get("emotion"),
-            "gender": adds.get("gender"),
-        })
-    return sorted(utts, key=lambda x: x["start_ms"])
+            "speaker": sys.intern(str(adds.get("speaker", "0"))),
+            "emotion": _intern(adds.get("emotion")),
+            "gender": _intern(adds.get("gender")),
+        }
+        for u in data["result"]["utterances"]
+        for adds in (u.get("additions") or {},)
+    ]
+    utts.sort(key=itemgetter("start_ms"))
+    return utts
 
 
 def fill_null_emotions(segments: list[dict]) -> None:
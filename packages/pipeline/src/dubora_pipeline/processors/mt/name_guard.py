@@ -148,6 +148,25 @@ def load_config(config_path: Optional[Path] = None) -> NameGuardConfig:
     )
 
 
+def _apply_replacements(part: str, replacements: list[tuple[int, int, str]]) -> str:
+    """
+    按位置从小到大一次拼接占位符（只切原串的区间片段，避免每次替换都复制整段文本）。
+    
+    与已替换区间重叠的替换会被跳过，保留起点靠前的那个：
+    第一轮不同长度的滑窗之间可能产生重叠候选，逐个切片替换会把已插入的占位符切坏。
+    """
+    pieces = []
+    cursor = 0
+    for start_pos, end_pos, placeholder in sorted(replacements, key=lambda x: x[0]):
+        if start_pos < cursor:
+            continue
+        pieces.append(part[cursor:start_pos])
+        pieces.append(placeholder)
+        cursor = end_pos
+    pieces.append(part[cursor:])
+    return "".join(pieces)
+
+
 class NameGuard:
     """人名识别器（打分器）"""
     
@@ -415,7 +434,6 @@ class NameGuard:
             # 2. 再匹配不带后缀的人名（如"平安"）
             # 3. 避免匹配到句子中间的非人名片段
             
-            replaced_part = part
             processed_ranges = []  # 记录已处理的字符范围 (start, end)
             
             # 提取所有候选词，按优先级排序
@@ -542,19 +560,7 @@ class NameGuard:
                 # 记录已处理的范围（在原始文本中的位置）
                 processed_ranges.append((start_pos, end_pos))
             
-            # 从后往前替换（避免位置偏移问题）
-            # 按位置从大到小排序
-            replacements.sort(key=lambda x: x[0], reverse=True)
-            
-            for start_pos, end_pos, placeholder in replacements:
-                # 从后往前替换，不需要调整位置偏移
-                replaced_part = (
-                    replaced_part[:start_pos] +
-                    placeholder +
-                    replaced_part[end_pos:]
-                )
-            
-            replaced_parts.append(replaced_part)
+            replaced_parts.append(_apply_replacements(part, replacements))
         
         # 重新组合（恢复 <sep>）
         replaced_text = sep_marker.join(replaced_parts)
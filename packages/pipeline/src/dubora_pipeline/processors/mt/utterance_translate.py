@@ -43,6 +43,15 @@ SAFETY_GAP_MS = 60  # 安全间隔（防止重叠）
 # 重翻译最大次数
 MAX_RETRIES = 3
 
+# 预编译正则（逐 utterance 调用的热路径）
+_SEP_RE = re.compile(r'\s*<sep>\s*')
+_NAME_PLACEHOLDER_RE = re.compile(r'<<NAME_\d+(?::[^>]*)?>>')
+_SLANG_RE = re.compile(r'<SLANG:[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_WORD_CHAR_RE = re.compile(r'\w')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_PUNCT_SPLIT_RE = re.compile(r'[,\.\?!—;:]\s*')
+
 # 赌博/牌局关键词（触发 domain hint）
 # 注意：「万」「条」不能放，它们作为量词太常见（五万=50K，三条路=three roads）
 _GAMBLING_KEYWORDS = (
@@ -74,16 +83,16 @@ def clean_translation_output(text: str) -> str:
         return text
 
     # 移除 <sep> 标记（可能带空格）
-    text = re.sub(r'\s*<sep>\s*', ' ', text)
+    text = _SEP_RE.sub(' ', text)
 
     # 移除 NAME 占位符（<<NAME_0>> 或 <<NAME_0:...>>）
-    text = re.sub(r'<<NAME_\d+(?::[^>]*)?>>', '', text)
+    text = _NAME_PLACEHOLDER_RE.sub('', text)
 
     # 移除 SLANG 标记（<SLANG:key>）
-    text = re.sub(r'<SLANG:[^>]+>', '', text)
+    text = _SLANG_RE.sub('', text)
 
     # 清理多余空格
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     text = text.strip()
 
     return text
@@ -101,10 +110,8 @@ def is_only_punctuation(text: str) -> bool:
     """
     if not text:
         return True
-    # 移除所有标点符号和空白字符，检查是否还有内容
-    text_without_punc = re.sub(r'[^\w\s]', '', text)
-    text_without_punc = re.sub(r'\s+', '', text_without_punc)
-    return not text_without_punc
+    # 去掉标点和空白后无内容 ⇔ 不含任何 \w 字符（一次 search，不构造中间串）
+    return _WORD_CHAR_RE.search(text) is None
 
 
 def pick_k(zh_tps: float) -> float:
@@ -138,7 +145,7 @@ def estimate_en_duration_ms(en_text: str) -> float:
         预计时长（毫秒）
     """
     # 只计算字母和数字（不含空格和标点）
-    en_chars = len(re.sub(r'[^a-zA-Z0-9]', '', en_text))
+    en_chars = len(_NON_ALNUM_RE.sub('', en_text))
     if en_chars == 0:
         return 0.0
 
@@ -404,9 +411,8 @@ def resegment_utterance(
 
     # Step 1: 在英文文本中找自然切分点（标点、空格）
     # 优先级：标点（, . ? ! — ; :） > 空格 > 单词边界
-    punctuation_pattern = r'[,\.\?!—;:]\s*'
     punctuation_positions = []
-    for match in re.finditer(punctuation_pattern, en_text):
+    for match in _PUNCT_SPLIT_RE.finditer(en_text):
         pos = match.end()  # 标点后的位置（包含后续空格）
         punctuation_positions.append(pos)
 
@@ -0,0 +1,31 @@
+"""
+TTS 引擎共用的 per-segment 调度逻辑。
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from dubora_pipeline.schema.dub_manifest import DubUtterance
+from dubora_pipeline.schema.tts_report import TTSSegmentReport
+
+
+def synthesize_segments_concurrently(
+    utterances: list[DubUtterance],
+    synthesize_one: Callable[[DubUtterance], TTSSegmentReport],
+    max_workers: int,
+) -> list[TTSSegmentReport]:
+    """
+    按 max_workers 并发合成各片段，返回与 utterances 同序的报告。
+
+    空文本只需写静音段：在调用线程处理，不占用合成 worker。
+    """
+    has_text = [bool(utt.text_en.strip()) for utt in utterances]
+    voiced = [utt for utt, ok in zip(utterances, has_text) if ok]
+    print(f"  [TTS] 合成 {len(voiced)} 个非空片段 (跳过 {len(utterances) - len(voiced)} 个空片段)")
+
+    # 网络 IO 主导：map 保持 manifest 顺序
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        voiced_reports = iter(executor.map(synthesize_one, voiced))
+        return [
+            next(voiced_reports) if ok else synthesize_one(utt)
+            for utt, ok in zip(utterances, has_text)
+        ]
@@ -10,6 +10,7 @@ import json
 import re
 import shutil
 import subprocess
+import wave
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -469,18 +470,13 @@ def synthesize_tts(
 
 def _create_silent_audio(output_path: str, duration: float):
     """Create silent audio file of specified duration in WAV 24k mono PCM format."""
-    cmd = [
-        "ffmpeg",
-        "-f", "lavfi",
-        "-i", f"anullsrc=r={CACHE_SAMPLE_RATE}:cl=mono",
-        "-t", str(duration),
-        "-ar", str(CACHE_SAMPLE_RATE),
-        "-ac", str(CACHE_CHANNELS),
-        "-sample_fmt", "s16",
-        "-y",
-        output_path,
-    ]
-    subprocess.run(cmd, check=True, capture_output=True)
+    # 静音就是全零 PCM，直接用 wave 写出，无需起 ffmpeg 进程
+    n_frames = max(0, round(duration * CACHE_SAMPLE_RATE))
+    with wave.open(output_path, "wb") as w:
+        w.setnchannels(CACHE_CHANNELS)
+        w.setsampwidth(2)
+        w.setframerate(CACHE_SAMPLE_RATE)
+        w.writeframes(bytes(n_frames * CACHE_CHANNELS * 2))
 
 
 def _allow_aggressive_compression(text: str) -> bool:
@@ -546,8 +542,6 @@ def _trim_silence(
         - trimmed_duration_sec: 去除静音后的实际时长（秒）
         - saved_ms: 节省的时长（毫秒）
     """
-    import subprocess
-    
     # 获取原始时长
     result = subprocess.run(
         ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", input_path],
@@ -638,8 +632,6 @@ def _align_segment_to_window(
         current_seg_start_ms: 当前句的开始时间（毫秒），用于检查重叠
         stats: 统计字典（用于记录 speedup 等信息）
     """
-    import subprocess
-    
     budget_sec = budget_ms / 1000.0
     
     # Step 0: Trim 静音（必须是第一步，在判断是否超长之前）
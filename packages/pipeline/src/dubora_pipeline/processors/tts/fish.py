@@ -8,13 +8,15 @@ import hashlib
 import re
 import shutil
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any
 
 from dubora_core.infra.fish_tts_client import call_fish_tts as _call_fish_tts
 from dubora_pipeline.schema.dub_manifest import DubManifest
 from dubora_pipeline.schema.tts_report import TTSReport, TTSSegmentReport, TTSSegmentStatus
 
+from ._common import synthesize_segments_concurrently
 from .azure import (
     _trim_silence,
     _normalize_audio_format,
@@ -46,7 +48,8 @@ def _generate_cache_key(text: str, reference_id: str) -> str:
 
 
 def _write_cache_atomic(cache_file: Path, source_file: Path):
-    temp_file = cache_file.with_suffix(".tmp")
+    # 每线程独立的 tmp 名，避免并发合成相同文本时互相覆盖
+    temp_file = cache_file.with_name(f"{cache_file.stem}.{threading.get_ident()}.tmp")
     shutil.copy2(source_file, temp_file)
     temp_file.replace(cache_file)
 
@@ -140,7 +143,7 @@ def synthesize_tts_per_segment(
         segments_dir: Output directory for per-segment WAVs
         temp_dir: Temporary directory for intermediate files
         api_key: Fish Audio API key
-        max_workers: Number of concurrent workers (reserved for future use)
+        max_workers: Number of concurrent workers
 
     Returns:
         TTSReport with per-segment synthesis results
@@ -154,9 +157,7 @@ def synthesize_tts_per_segment(
     cache_dir = temp_path / CACHE_ENGINE
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    segment_reports: List[TTSSegmentReport] = []
-
-    for utt in dub_manifest.utterances:
+    def _synthesize_one(utt) -> TTSSegmentReport:
         utt_id = utt.utt_id
         text = utt.text_en.strip()
         budget_ms = utt.budget_ms
@@ -170,19 +171,16 @@ def synthesize_tts_per_segment(
 
         if not text:
             _create_silent_audio(str(segment_file), budget_ms / 1000.0)
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=0,
-                    trimmed_ms=0,
-                    final_ms=budget_ms,
-                    rate=1.0,
-                    status=TTSSegmentStatus.SUCCESS,
-                    output_path=str(segment_file.relative_to(output_dir.parent)),
-                )
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=0,
+                trimmed_ms=0,
+                final_ms=budget_ms,
+                rate=1.0,
+                status=TTSSegmentStatus.SUCCESS,
+                output_path=str(segment_file.relative_to(output_dir.parent)),
             )
-            continue
 
         voice_info = voice_assignment["speakers"].get(role_key, {})
         sample_audio = voice_info.get("sample_audio_local", "")
@@ -195,20 +193,17 @@ def synthesize_tts_per_segment(
         use_ref_id = (not use_sample) and bool(reference_id)
 
         if not use_sample and not use_ref_id:
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=0,
-                    trimmed_ms=0,
-                    final_ms=0,
-                    rate=1.0,
-                    status=TTSSegmentStatus.FAILED,
-                    output_path="",
-                    error=f"Fish TTS: no sample_audio or reference_id for role={role_key} (speaker={speaker})",
-                )
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=0,
+                trimmed_ms=0,
+                final_ms=0,
+                rate=1.0,
+                status=TTSSegmentStatus.FAILED,
+                output_path="",
+                error=f"Fish TTS: no sample_audio or reference_id for role={role_key} (speaker={speaker})",
             )
-            continue
 
         # Cache key uses the actually-used voice identifier
         voice_key = sample_audio if use_sample else reference_id
@@ -291,35 +286,35 @@ def synthesize_tts_per_segment(
             trimmed_file.unlink(missing_ok=True)
             segment_file_raw.unlink(missing_ok=True)
 
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=raw_ms,
-                    trimmed_ms=trimmed_ms,
-                    final_ms=final_ms,
-                    rate=rate,
-                    status=status,
-                    output_path=str(segment_file.relative_to(output_dir.parent)),
-                )
-            )
             print(f"  [fish] [{utt_id}] {raw_ms}ms -> {trimmed_ms}ms -> {final_ms}ms (rate={rate:.2f}x)")
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=raw_ms,
+                trimmed_ms=trimmed_ms,
+                final_ms=final_ms,
+                rate=rate,
+                status=status,
+                output_path=str(segment_file.relative_to(output_dir.parent)),
+            )
 
         except Exception as e:
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=0,
-                    trimmed_ms=0,
-                    final_ms=0,
-                    rate=1.0,
-                    status=TTSSegmentStatus.FAILED,
-                    output_path="",
-                    error=str(e),
-                )
-            )
             print(f"  [fish] [{utt_id}] Failed: {e}")
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=0,
+                trimmed_ms=0,
+                final_ms=0,
+                rate=1.0,
+                status=TTSSegmentStatus.FAILED,
+                output_path="",
+                error=str(e),
+            )
+
+    segment_reports = synthesize_segments_concurrently(
+        dub_manifest.utterances, _synthesize_one, max_workers,
+    )
 
     return TTSReport(
         audio_duration_ms=dub_manifest.audio_duration_ms,
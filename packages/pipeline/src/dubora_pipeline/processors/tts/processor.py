@@ -14,6 +14,7 @@ TTS Processor: 语音合成（唯一对外入口）
 - volcengine.py: VolcEngine TTS 实现
 - fish.py: Fish Audio TTS 实现（声音克隆）
 """
+from collections import Counter
 from typing import Any, Dict, Optional
 
 from .._types import ProcessorResult
@@ -101,6 +102,9 @@ def run_per_segment(
             max_workers=max_workers,
         )
 
+    # 一次遍历同时得到说话人数与分布（诊断用）
+    speaker_counts = Counter(utt.speaker for utt in dub_manifest.utterances)
+
     return ProcessorResult(
         outputs=[],
         data={
@@ -108,8 +112,8 @@ def run_per_segment(
             "tts_report": tts_report,
         },
         metrics={
-            "total_segments": tts_report.total_segments,
-            "success_count": tts_report.success_count,
-            "failed_count": tts_report.failed_count,
+            **tts_report.summary(),
+            "speakers_count": len(speaker_counts),
+            "speaker_distribution": dict(speaker_counts),
         },
     )
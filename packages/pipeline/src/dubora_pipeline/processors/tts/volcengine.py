@@ -12,9 +12,11 @@ import json
 import re
 import shutil
 import subprocess
+import threading
+import wave
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 
 from dubora_core.config import emotion_supports_lang
 from dubora_core.infra.tts_client import (
@@ -35,10 +37,10 @@ except ImportError:
     AUDIO_DIAGNOSTICS_AVAILABLE = False
 
 # Import audio alignment functions from azure.py
+from ._common import synthesize_segments_concurrently
 from .azure import (
     _align_segment_to_window,
     _trim_silence,
-    _concatenate_with_gaps,
     _create_silent_audio,
     _normalize_audio_format,
 )
@@ -115,7 +117,8 @@ def _append_manifest(manifest_path: Path, seg_id: int, cache_key: str, voice_id:
 
 def _write_cache_atomic(cache_file: Path, source_file: Path):
     """Write cache file atomically."""
-    temp_file = cache_file.with_suffix(".tmp")
+    # 每线程独立的 tmp 名，避免并发合成相同文本时互相覆盖
+    temp_file = cache_file.with_name(f"{cache_file.stem}.{threading.get_ident()}.tmp")
     shutil.copy2(source_file, temp_file)
     temp_file.replace(cache_file)
 
@@ -189,9 +192,7 @@ def synthesize_tts_per_segment(
     # Get cache paths
     cache_dir, manifest_path = _get_cache_paths(temp_path)
 
-    segment_reports: List[TTSSegmentReport] = []
-
-    for utt in dub_manifest.utterances:
+    def _synthesize_one(utt) -> TTSSegmentReport:
         utt_id = utt.utt_id
         text = utt.text_en.strip()
         budget_ms = utt.budget_ms
@@ -206,39 +207,33 @@ def synthesize_tts_per_segment(
         if not text:
             # Empty text - create silent audio
             _create_silent_audio(str(segment_file), budget_ms / 1000.0)
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=0,
-                    trimmed_ms=0,
-                    final_ms=budget_ms,
-                    rate=1.0,
-                    status=TTSSegmentStatus.SUCCESS,
-                    output_path=str(segment_file.relative_to(output_dir.parent)),
-                )
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=0,
+                trimmed_ms=0,
+                final_ms=budget_ms,
+                rate=1.0,
+                status=TTSSegmentStatus.SUCCESS,
+                output_path=str(segment_file.relative_to(output_dir.parent)),
             )
-            continue
 
         # Get voice configuration from voice_assignment（role_id 为索引键）。
         # 无任何 fallback：未分配 role 或 role.voice_type 缺失 → 标 failed，不偷偷用兜底音色。
         voice_info = voice_assignment["speakers"].get(role_key, {})
         voice_id = voice_info.get("voice_type", "")
         if not voice_id:
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=0,
-                    trimmed_ms=0,
-                    final_ms=0,
-                    rate=1.0,
-                    status=TTSSegmentStatus.FAILED,
-                    output_path="",
-                    error=f"VolcEngine TTS: no voice_type for role={role_key or '<unassigned>'}",
-                )
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=0,
+                trimmed_ms=0,
+                final_ms=0,
+                rate=1.0,
+                status=TTSSegmentStatus.FAILED,
+                output_path="",
+                error=f"VolcEngine TTS: no voice_type for role={role_key or '<unassigned>'}",
             )
-            continue
         # emotion：只传目标语言支持的（emotions.json 的 lang 字段）
         # 不支持的（如 coldness/hate 只有 zh）不传，走默认语气，避免 API 报错
         raw_emotion = utt.emotion
@@ -272,25 +267,28 @@ def synthesize_tts_per_segment(
                 )
 
                 # Convert to WAV
-                if format == "pcm":
-                    temp_pcm = temp_path / f"seg_{utt_id}_temp.pcm"
-                    with open(temp_pcm, "wb") as f:
-                        f.write(audio_bytes)
-
+                if format == "pcm" and sample_rate == CACHE_SAMPLE_RATE:
+                    # 采样率一致：PCM 直接加 WAV 头写出，不落临时文件、不起 ffmpeg
+                    with wave.open(str(segment_file_raw), "wb") as w:
+                        w.setnchannels(CACHE_CHANNELS)
+                        w.setsampwidth(2)
+                        w.setframerate(sample_rate)
+                        w.writeframes(audio_bytes)
+                elif format == "pcm":
+                    # 需要重采样：PCM 经 stdin 喂给 ffmpeg，省掉临时 .pcm 文件
                     cmd = [
                         "ffmpeg",
                         "-f", "s16le",
                         "-ar", str(sample_rate),
                         "-ac", str(CACHE_CHANNELS),
-                        "-i", str(temp_pcm),
+                        "-i", "pipe:0",
                         "-ar", str(CACHE_SAMPLE_RATE),
                         "-ac", str(CACHE_CHANNELS),
                         "-sample_fmt", "s16",
                         "-y",
                         str(segment_file_raw),
                     ]
-                    subprocess.run(cmd, check=True, capture_output=True)
-                    temp_pcm.unlink(missing_ok=True)
+                    subprocess.run(cmd, input=audio_bytes, check=True, capture_output=True)
                 else:
                     temp_audio = temp_path / f"seg_{utt_id}_temp.{format}"
                     with open(temp_audio, "wb") as f:
@@ -357,35 +355,35 @@ def synthesize_tts_per_segment(
             trimmed_file.unlink(missing_ok=True)
             segment_file_raw.unlink(missing_ok=True)
 
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=raw_ms,
-                    trimmed_ms=trimmed_ms,
-                    final_ms=final_ms,
-                    rate=rate,
-                    status=status,
-                    output_path=str(segment_file.relative_to(output_dir.parent)),
-                )
-            )
             print(f"  ✅ [{utt_id}] {raw_ms}ms → {trimmed_ms}ms → {final_ms}ms (rate={rate:.2f}x)")
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=raw_ms,
+                trimmed_ms=trimmed_ms,
+                final_ms=final_ms,
+                rate=rate,
+                status=status,
+                output_path=str(segment_file.relative_to(output_dir.parent)),
+            )
 
         except Exception as e:
-            segment_reports.append(
-                TTSSegmentReport(
-                    utt_id=utt_id,
-                    budget_ms=budget_ms,
-                    raw_ms=0,
-                    trimmed_ms=0,
-                    final_ms=0,
-                    rate=1.0,
-                    status=TTSSegmentStatus.FAILED,
-                    output_path="",
-                    error=str(e),
-                )
-            )
             print(f"  ❌ [{utt_id}] Failed: {e}")
+            return TTSSegmentReport(
+                utt_id=utt_id,
+                budget_ms=budget_ms,
+                raw_ms=0,
+                trimmed_ms=0,
+                final_ms=0,
+                rate=1.0,
+                status=TTSSegmentStatus.FAILED,
+                output_path="",
+                error=str(e),
+            )
+
+    segment_reports = synthesize_segments_concurrently(
+        dub_manifest.utterances, _synthesize_one, max_workers,
+    )
 
     return TTSReport(
         audio_duration_ms=dub_manifest.audio_duration_ms,
@@ -29,14 +29,35 @@ Prompt 模板加载器
     frag = load_shared("no_chinese_policy")
 """
 import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import yaml
+from dubora_core.utils.logger import warning
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+    _LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    _LIBYAML_AVAILABLE = False
 
 _PROMPTS_DIR = Path(__file__).parent
 _cache: Dict[str, dict] = {}
 _shared: Optional[dict] = None
+# (模板名, 字段) → 预编译的渲染函数，避免每次渲染重新扫描模板
+_template_cache: dict[tuple[str, str], Callable[[dict[str, Any]], str]] = {}
+_loader_warned = False
+
+
+def _safe_load(f) -> Any:
+    """yaml.safe_load 的等价实现，优先用 libyaml 的 C 解析器。"""
+    global _loader_warned
+    if not _LIBYAML_AVAILABLE and not _loader_warned:
+        _loader_warned = True
+        warning("libyaml not available, prompt YAML falls back to the pure-Python loader")
+    return yaml.load(f, Loader=_YamlLoader)
 
 
 def _load_yaml(name: str) -> dict:
@@ -44,7 +65,7 @@ def _load_yaml(name: str) -> dict:
     if name not in _cache:
         yaml_path = _PROMPTS_DIR / f"{name}.yaml"
         with open(yaml_path, "r", encoding="utf-8") as f:
-            _cache[name] = yaml.safe_load(f) or {}
+            _cache[name] = _safe_load(f) or {}
     return _cache[name]
 
 
@@ -53,11 +74,7 @@ def _get_shared() -> dict:
     global _shared
     if _shared is None:
         shared_path = _PROMPTS_DIR / "mt_shared.yaml"
-        if shared_path.exists():
-            with open(shared_path, "r", encoding="utf-8") as f:
-                _shared = yaml.safe_load(f) or {}
-        else:
-            _shared = {}
+        _shared = _load_yaml("mt_shared") if shared_path.exists() else {}
     return _shared
 
 
@@ -74,38 +91,88 @@ def load_shared(name: str) -> str:
     return _get_shared().get(name, "")
 
 
-def _substitute(text: str, **kwargs: Any) -> str:
-    """使用 string.Template 进行变量替换（$variable）。"""
-    if not text:
-        return ""
-    return string.Template(text).safe_substitute(**kwargs)
+def _compile_template(text: str) -> Callable[[dict[str, Any]], str]:
+    """把模板预编译为 (字面量, 变量名, 原文) 片段序列，渲染时只做拼接。
+
+    语义与 string.Template.safe_substitute 一致：$$ → $；缺失变量和非法占位符原样保留。
+    """
+    parts = []
+    literal = []
+    pos = 0
+    for m in string.Template.pattern.finditer(text):
+        literal.append(text[pos:m.start()])
+        pos = m.end()
+        if m.group("escaped") is not None:
+            literal.append("$")
+            continue
+        var = m.group("named") or m.group("braced")
+        if var is None:
+            literal.append(m.group())
+            continue
+        parts.append(("".join(literal), var, m.group()))
+        literal = []
+    tail = "".join(literal) + text[pos:]
+
+    if not parts:
+        return lambda kwargs: tail
+
+    def render(kwargs: dict[str, Any]) -> str:
+        out = []
+        for lit, var, raw in parts:
+            out.append(lit)
+            out.append(str(kwargs[var]) if var in kwargs else raw)
+        out.append(tail)
+        return "".join(out)
+
+    return render
+
+
+def _get_template(name: str, field: str, text: str) -> Callable[[dict[str, Any]], str]:
+    """按 (name, field) 缓存预编译的渲染函数。"""
+    key = (name, field)
+    render = _template_cache.get(key)
+    if render is None:
+        render = _compile_template(text)
+        _template_cache[key] = render
+    return render
 
 
 class RenderedPrompt:
-    """渲染后的 prompt，包含 system/user/text 字段。"""
+    """渲染后的 prompt，包含 system/user/text 字段。
+
+    只读：渲染结果会被 load_prompt 缓存并在调用方之间共享，禁止修改字段。
+    """
 
     __slots__ = ("system", "user", "text")
 
     def __init__(self, system: str = "", user: str = "", text: str = ""):
-        self.system = system.strip()
-        self.user = user.strip()
-        self.text = text.strip()
+        # 只 strip 实际传入的字段（chat 模式通常没有 text，单段模式没有 system/user）
+        object.__setattr__(self, "system", system.strip() if system else "")
+        object.__setattr__(self, "user", user.strip() if user else "")
+        object.__setattr__(self, "text", text.strip() if text else "")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"RenderedPrompt is read-only (cannot set {name!r})")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"RenderedPrompt is read-only (cannot delete {name!r})")
 
     def __repr__(self) -> str:
-        parts = []
-        if self.system:
-            parts.append(f"system={len(self.system)} chars")
-        if self.user:
-            parts.append(f"user={len(self.user)} chars")
-        if self.text:
-            parts.append(f"text={len(self.text)} chars")
-        return f"RenderedPrompt({', '.join(parts)})"
+        body = (
+            (f"system={len(self.system)} chars, " if self.system else "")
+            + (f"user={len(self.user)} chars, " if self.user else "")
+            + (f"text={len(self.text)} chars, " if self.text else "")
+        )
+        return f"RenderedPrompt({body[:-2]})"
 
 
 def load_prompt(name: str, **kwargs: Any) -> RenderedPrompt:
     """
     加载并渲染 prompt 模板。
 
+    相同 (name, kwargs) 的渲染结果会被缓存复用，返回的 RenderedPrompt 只读。
+    缓存 key 含变量值的类型：2 与 2.0、1 与 True 哈希相等但渲染结果不同，不能共用。
+
     Args:
         name: 模板名，格式 "file_name" 或 "file_name.section.subsection"
               例: "mt_utterance_translate" 或 "mt_utterance_translate.retry_level_1"
@@ -114,6 +181,21 @@ def load_prompt(name: str, **kwargs: Any) -> RenderedPrompt:
     Returns:
         RenderedPrompt，包含 system/user/text 字段
     """
+    try:
+        frozen = tuple(sorted((k, type(v), v) for k, v in kwargs.items()))
+        hash(frozen)
+    except TypeError:
+        # 变量值不可哈希（如 list/dict），直接渲染不走缓存
+        return _render(name, kwargs)
+    return _render_cached(name, frozen)
+
+
+@lru_cache(maxsize=1024)
+def _render_cached(name: str, frozen_kwargs: tuple[tuple[str, type, Any], ...]) -> RenderedPrompt:
+    return _render(name, {k: v for k, _, v in frozen_kwargs})
+
+
+def _render(name: str, kwargs: dict[str, Any]) -> RenderedPrompt:
     parts = name.split(".", 1)
     file_name = parts[0]
     section_path = parts[1] if len(parts) > 1 else None
@@ -132,13 +214,21 @@ def load_prompt(name: str, **kwargs: Any) -> RenderedPrompt:
 
     if not isinstance(data, dict):
         # 如果 section 直接是字符串，作为 text 返回
-        return RenderedPrompt(text=_substitute(str(data), **kwargs))
-
-    system = _substitute(data.get("system", ""), **kwargs)
-    user = _substitute(data.get("user", ""), **kwargs)
-    text = _substitute(data.get("prompt", ""), **kwargs)
-
-    return RenderedPrompt(system=system, user=user, text=text)
+        text = str(data)
+        if not text:
+            return RenderedPrompt()
+        return RenderedPrompt(text=_get_template(name, "", text)(kwargs))
+
+    rendered = {}
+    for field in ("system", "user", "prompt"):
+        raw = data.get(field, "")
+        rendered[field] = _get_template(name, field, raw)(kwargs) if raw else ""
+
+    return RenderedPrompt(
+        system=rendered["system"],
+        user=rendered["user"],
+        text=rendered["prompt"],
+    )
 
 
 def clear_cache() -> None:
@@ -146,3 +236,20 @@ def clear_cache() -> None:
     global _shared
     _cache.clear()
     _shared = None
+    _template_cache.clear()
+    _render_cached.cache_clear()
+
+
+def _preload() -> None:
+    """导入时预解析目录下全部 YAML，避免首个 load_prompt 在关键路径上做 IO + 解析。
+
+    单个文件解析失败不影响导入，留给 load_prompt 时再抛出。
+    """
+    for yaml_path in sorted(_PROMPTS_DIR.glob("*.yaml")):
+        try:
+            _load_yaml(yaml_path.stem)
+        except (OSError, yaml.YAMLError):
+            continue
+
+
+_preload()
@@ -6,10 +6,28 @@ Each method maps to a Worker API endpoint on the web server.
 """
 from __future__ import annotations
 
-from typing import Optional
+import json
+from typing import Any, Optional
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class RemoteStore:
     """HTTP proxy for DbStore. Same method signatures, each call hits the Worker API."""
@@ -37,12 +55,21 @@ class RemoteStore:
         r.raise_for_status()
         return r
 
+    @staticmethod
+    def _encode(kwargs: dict) -> dict:
+        # Serialize json= bodies up front (the session already sends Content-Type: application/json)
+        if "json" in kwargs:
+            kwargs["data"] = _dumps(kwargs.pop("json"))
+        return kwargs
+
     def _post(self, path: str, **kwargs) -> requests.Response:
+        kwargs = self._encode(kwargs)
         r = self._session.post(self._url(path), **kwargs)
         r.raise_for_status()
         return r
 
     def _patch(self, path: str, **kwargs) -> requests.Response:
+        kwargs = self._encode(kwargs)
         r = self._session.patch(self._url(path), **kwargs)
         r.raise_for_status()
         return r
@@ -51,7 +78,7 @@ class RemoteStore:
 
     def claim_any_pending_task(self, *, executable_types: list[str]) -> Optional[dict]:
         r = self._post("/worker/claim", json={"executable_types": executable_types})
-        return r.json().get("task")
+        return _loads(r.content).get("task")
 
     def complete_task(self, task_id: int) -> None:
         task = self._current_task or {}
@@ -77,7 +104,7 @@ class RemoteStore:
     def get_episode(self, episode_id: int) -> Optional[dict]:
         try:
             r = self._get(f"/worker/episodes/{episode_id}")
-            return r.json().get("episode")
+            return _loads(r.content).get("episode")
         except requests.HTTPError as e:
             if e.response.status_code == 404:
                 return None
@@ -87,26 +114,26 @@ class RemoteStore:
 
     def get_drama_synopsis(self, drama_id: int) -> str:
         r = self._get(f"/worker/dramas/{drama_id}/synopsis")
-        return r.json().get("synopsis", "")
+        return _loads(r.content).get("synopsis", "")
 
     # ── Cues ─────────────────────────────────────────────────────
 
     def has_cues(self, episode_id: int) -> bool:
         r = self._get(f"/worker/episodes/{episode_id}/has-cues")
-        return r.json().get("has_cues", False)
+        return _loads(r.content).get("has_cues", False)
 
     def get_cues(self, episode_id: int) -> list[dict]:
         r = self._get(f"/worker/episodes/{episode_id}/cues")
-        return r.json().get("cues", [])
+        return _loads(r.content).get("cues", [])
 
     def get_cues_for_utterance(self, utterance_id: int) -> list[dict]:
         # Use episode_id=0 as placeholder; endpoint uses utterance_id query param
         r = self._get("/worker/episodes/0/cues", params={"utterance_id": utterance_id})
-        return r.json().get("cues", [])
+        return _loads(r.content).get("cues", [])
 
     def insert_cues(self, episode_id: int, rows: list[dict]) -> list[int]:
         r = self._post(f"/worker/episodes/{episode_id}/cues/insert", json={"cues": rows})
-        return r.json().get("cue_ids", [])
+        return _loads(r.content).get("cue_ids", [])
 
     def update_cue(self, cue_id: int, **fields) -> None:
         self._patch(f"/worker/cues/{cue_id}", json=fields)
@@ -114,26 +141,26 @@ class RemoteStore:
     def delete_episode_cues(self, episode_id: int) -> int:
         r = self._session.delete(self._url(f"/worker/episodes/{episode_id}/cues"))
         r.raise_for_status()
-        return r.json().get("deleted", 0)
+        return _loads(r.content).get("deleted", 0)
 
     def delete_episode_utterances(self, episode_id: int) -> int:
         r = self._session.delete(self._url(f"/worker/episodes/{episode_id}/utterances"))
         r.raise_for_status()
-        return r.json().get("deleted", 0)
+        return _loads(r.content).get("deleted", 0)
 
     # ── Utterances ───────────────────────────────────────────────
 
     def get_utterances(self, episode_id: int) -> list[dict]:
         r = self._get(f"/worker/episodes/{episode_id}/utterances")
-        return r.json().get("utterances", [])
+        return _loads(r.content).get("utterances", [])
 
     def get_dirty_utterances_for_translate(self, episode_id: int) -> list[dict]:
         r = self._get(f"/worker/episodes/{episode_id}/utterances", params={"dirty": "translate"})
-        return r.json().get("utterances", [])
+        return _loads(r.content).get("utterances", [])
 
     def get_dirty_utterances_for_tts(self, episode_id: int) -> list[dict]:
         r = self._get(f"/worker/episodes/{episode_id}/utterances", params={"dirty": "tts"})
-        return r.json().get("utterances", [])
+        return _loads(r.content).get("utterances", [])
 
     def update_utterance(self, utterance_id: int, **fields) -> None:
         self._patch(f"/worker/utterances/{utterance_id}", json=fields)
@@ -145,23 +172,23 @@ class RemoteStore:
             "max_gap_ms": max_gap_ms,
             "max_duration_ms": max_duration_ms,
         })
-        return r.json().get("utterances", [])
+        return _loads(r.content).get("utterances", [])
 
     # ── Roles (by drama_id) ──────────────────────────────────────
 
     def get_roles_by_id(self, drama_id: int) -> dict[int, str]:
         r = self._get(f"/worker/dramas/{drama_id}/roles")
-        data = r.json().get("by_id", {})
+        data = _loads(r.content).get("by_id", {})
         return {int(k): v for k, v in data.items()}
 
     def get_role_name_map(self, drama_id: int) -> dict[int, str]:
         r = self._get(f"/worker/dramas/{drama_id}/roles")
-        data = r.json().get("name_map", {})
+        data = _loads(r.content).get("name_map", {})
         return {int(k): v for k, v in data.items()}
 
     def get_roles(self, drama_id: int) -> list[dict]:
         r = self._get(f"/worker/dramas/{drama_id}/roles")
-        return r.json().get("roles", [])
+        return _loads(r.content).get("roles", [])
 
     def update_role_sample_audio(self, role_id: int, sample_audio: str) -> None:
         self._patch(f"/worker/roles/{role_id}/sample-audio", json={"sample_audio": sample_audio})
@@ -170,7 +197,7 @@ class RemoteStore:
 
     def get_dict_map(self, drama_id: int, type: str) -> dict[str, str]:
         r = self._get(f"/worker/dramas/{drama_id}/glossary", params={"type": type})
-        return r.json().get("map", {})
+        return _loads(r.content).get("map", {})
 
     def upsert_dict_entry(self, drama_id: int, type: str, src: str, target: str) -> None:
         self._post(f"/worker/dramas/{drama_id}/glossary", json={
@@ -193,7 +220,7 @@ class RemoteStore:
         r = self._get("/worker/tasks/latest-succeeded", params={
             "episode_id": episode_id, "type": task_type,
         })
-        return r.json().get("task")
+        return _loads(r.content).get("task")
 
     def update_task_context(self, task_id: int, updates: dict) -> None:
         self._patch(f"/worker/tasks/{task_id}/context", json=updates)
@@ -15,6 +15,16 @@ from dubora_core.manifest import resolve_artifact_path
 from dubora_core.utils.logger import info, error
 
 
+# 文件后缀 → artifact kind（未列出的为 "bin"）
+_KIND_BY_SUFFIX = {
+    ".json": "json",
+    ".srt": "srt",
+    ".wav": "wav",
+    ".mp4": "mp4",
+    ".mp3": "mp3",
+}
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -118,15 +128,7 @@ class PhaseRunner:
         """根据文件路径猜测 artifact kind。"""
         if path.is_dir():
             return "dir"
-        suffix = path.suffix.lower()
-        kind_map = {
-            ".json": "json",
-            ".srt": "srt",
-            ".wav": "wav",
-            ".mp4": "mp4",
-            ".mp3": "mp3",
-        }
-        return kind_map.get(suffix, "bin")
+        return _KIND_BY_SUFFIX.get(path.suffix.lower(), "bin")
 
     def run_phase(
         self,
@@ -86,15 +86,26 @@ class TTSReport:
     def all_succeeded(self) -> bool:
         return self.failed_count == 0
 
+    def summary(self) -> dict:
+        """total/success/failed 计数，一次遍历算完（供 metrics / 序列化使用）。"""
+        failed = 0
+        for s in self.segments:
+            if s.status == TTSSegmentStatus.FAILED:
+                failed += 1
+        total = len(self.segments)
+        return {
+            "total_segments": total,
+            "success_count": total - failed,
+            "failed_count": failed,
+        }
+
 
 def tts_report_to_dict(report: TTSReport) -> dict:
     """Serialize TTSReport to dict for JSON output."""
     return {
         "audio_duration_ms": report.audio_duration_ms,
         "segments_dir": report.segments_dir,
-        "total_segments": report.total_segments,
-        "success_count": report.success_count,
-        "failed_count": report.failed_count,
+        **report.summary(),
         "segments": [
             {
                 "utt_id": s.utt_id,
@@ -12,11 +12,15 @@ Schema: Provider-agnostic data contracts shared across the pipeline.
 依赖规则：
 - schema 只能被依赖，不能依赖 models 或 processors
 """
+import sys
 from dataclasses import dataclass
 from typing import List, Optional
 
+# 3.10+ 用 slots 去掉逐实例 __dict__（逐词/逐句对象数量大）；3.9 退化为普通 dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Word:
     """
     ASR 返回的单个词/字级别信息。
@@ -33,7 +37,7 @@ class Word:
     speaker: str = ""  # 可选，word 级别可能没有 speaker
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Utterance:
     """
     ASR 返回的原始话语单元。
@@ -56,7 +60,7 @@ class Utterance:
     gender: Optional[str] = None  # 可选，性别标签
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Segment:
     """
     已完成 speaker-aware 切分/合并的中间数据结构。
@@ -92,7 +96,7 @@ class Segment:
 SubtitleSegment = Segment
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SrtCue:
     """
     最终用于 SRT 格式化的字幕单元。
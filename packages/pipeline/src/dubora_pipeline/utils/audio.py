@@ -0,0 +1,19 @@
+"""
+音频探测工具（ffprobe）。
+"""
+import subprocess
+
+
+def probe_duration_ms(audio_path: str) -> int:
+    """Probe audio duration using ffprobe."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
+        capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {result.stderr}")
+    duration_str = result.stdout.strip()
+    if duration_str == "N/A" or not duration_str:
+        raise RuntimeError(f"ffprobe returned invalid duration for {audio_path}")
+    return int(float(duration_str) * 1000)
@@ -1,19 +1,33 @@
-from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Mapping
 
 
 def srt_timestamp(seconds: float) -> str:
     """Convert seconds to SRT timestamp (HH:MM:SS,mmm)."""
-    td = timedelta(seconds=max(0.0, seconds))
-    total_ms = int(td.total_seconds() * 1000)
-    hh = total_ms // 3_600_000
-    mm = (total_ms % 3_600_000) // 60_000
-    ss = (total_ms % 60_000) // 1_000
-    ms = total_ms % 1_000
+    # 先取整到微秒（与 timedelta 一致），再截断到毫秒
+    return srt_timestamp_ms(round(max(0.0, seconds) * 1_000_000) // 1_000)
+
+
+@lru_cache(maxsize=8192)
+def srt_timestamp_ms(total_ms: int) -> str:
+    """Convert integer milliseconds to SRT timestamp (HH:MM:SS,mmm).
+
+    纯整数运算；按毫秒值缓存，同一批 cue 生成多语言 SRT 时时间戳只格式化一次。
+    """
+    ss, ms = divmod(max(0, total_ms), 1_000)
+    mm, ss = divmod(ss, 60)
+    hh, mm = divmod(mm, 60)
     return f"{hh:02d}:{mm:02d}:{ss:02d},{ms:03d}"
 
 
+def _stamp(seg: Mapping, key: str) -> str:
+    ms = seg.get(f"{key}_ms")
+    if ms is not None:
+        return srt_timestamp_ms(int(ms))
+    return srt_timestamp(float(seg[key]))
+
+
 def write_srt_from_segments(
     segments: Iterable[Mapping],
     out_path: str,
@@ -25,43 +39,41 @@ def write_srt_from_segments(
     Write a simple SRT file from Whisper-like segments.
 
     segments: iterable of dicts with keys: start, end, text_key
+      (if start_ms / end_ms integer fields are present they are used directly, skipping float math)
     Tolerant to different field names: tries text_key, then "text", then "sentence", then "transcript"
     include_speaker: if True, prefix text with [Speaker X] when speaker info is available
     """
-    lines: list[str] = []
-    index = 1
-    for seg in segments:
-        start = srt_timestamp(float(seg["start"]))
-        end = srt_timestamp(float(seg["end"]))
-        # Tolerant text extraction: try multiple possible keys
-        text = (
-            seg.get(text_key)
-            or seg.get("text")
-            or seg.get("sentence")
-            or seg.get("transcript")
-            or ""
-        )
-        text = str(text).strip() if text else ""
-        if not text:
-            continue
-        
-        # 如果启用 speaker 信息且存在，在文本前添加 [Speaker X]
-        if include_speaker and "speaker" in seg:
-            speaker = seg.get("speaker", "")
-            if speaker and speaker != "speaker_0":  # 避免显示默认值
-                text = f"[{speaker}] {text}"
-        
-        lines.append(str(index))
-        lines.append(f"{start} --> {end}")
-        lines.append(text)
-        lines.append("")  # blank line
-        index += 1
-
     # Ensure output directory exists
     out_file = Path(out_path)
     out_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    def _texts():
+        for seg in segments:
+            # Tolerant text extraction: try multiple possible keys
+            text = (
+                seg.get(text_key)
+                or seg.get("text")
+                or seg.get("sentence")
+                or seg.get("transcript")
+                or ""
+            )
+            text = str(text).strip() if text else ""
+            if not text:
+                continue
 
+            # 如果启用 speaker 信息且存在，在文本前添加 [Speaker X]
+            if include_speaker and "speaker" in seg:
+                speaker = seg.get("speaker", "")
+                if speaker and speaker != "speaker_0":  # 避免显示默认值
+                    text = f"[{speaker}] {text}"
+            yield seg, text
 
+    # 条目之间以空行分隔（首条之前不加），逐条编码写入二进制缓冲
+    with open(out_path, "wb", buffering=1 << 20) as f:
+        for index, (seg, text) in enumerate(_texts(), 1):
+            prefix = "\n" if index > 1 else ""
+            f.write(
+                f"{prefix}{index}\n"
+                f"{_stamp(seg, 'start')} --> {_stamp(seg, 'end')}\n"
+                f"{text}\n".encode()
+            )
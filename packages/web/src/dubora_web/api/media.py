@@ -16,6 +16,22 @@ from dubora_core.config.settings import get_faststart_cache_dir
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 常见媒体后缀 → MIME：一次 dict 查找；不在表里的才走 mimetypes.guess_type
+_MIME_BY_EXT = {
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".webm": "video/webm",
+    ".mkv": "video/x-matroska",
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".vtt": "text/vtt",
+}
+
 
 def _needs_faststart(file_path: Path) -> bool:
     """检测 MP4 文件是否需要 faststart（moov atom 在 mdat 之后）。"""
@@ -124,9 +140,9 @@ async def serve_media(request: Request, key: str):
     local = _ensure_faststart(local, key)
 
     # 检测 MIME 类型
-    mime_type, _ = mimetypes.guess_type(str(local))
+    mime_type = _MIME_BY_EXT.get(local.suffix.lower())
     if mime_type is None:
-        mime_type = "application/octet-stream"
+        mime_type = mimetypes.guess_type(str(local))[0] or "application/octet-stream"
 
     file_size = local.stat().st_size
     range_header = request.headers.get("range")
@@ -1,6 +1,7 @@
 """
 Voices API: voice catalogue + TTS synthesis preview (with server-side cache)
 """
+import asyncio
 import hashlib
 import json
 import os
@@ -12,6 +13,11 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from dubora_core.infra.tts_client import call_volcengine_tts as _call_volcengine_tts
 
 router = APIRouter()
@@ -35,15 +41,19 @@ def _cache_key(voice_id: str, text: str, emotion: str) -> str:
 def _load_manifest() -> List[Dict[str, Any]]:
     if not _MANIFEST_PATH.exists():
         return []
-    with open(_MANIFEST_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    data = _MANIFEST_PATH.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def _save_manifest(entries: List[Dict[str, Any]]) -> None:
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # 整体序列化成 bytes 后一次写入，再原子 replace
+    if orjson is not None:
+        payload = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(entries, ensure_ascii=False, indent=2).encode("utf-8")
     tmp = _MANIFEST_PATH.with_suffix(".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(entries, f, ensure_ascii=False, indent=2)
+    tmp.write_bytes(payload)
     tmp.replace(_MANIFEST_PATH)
 
 
@@ -174,8 +184,10 @@ async def synthesize_voice(req: SynthesizeRequest) -> Dict[str, Any]:
                 detail="DOUBAO_APPID / DOUBAO_ACCESS_TOKEN not configured",
             )
 
+        # 流式 HTTP 合成是阻塞调用：放到线程里跑，不占住事件循环，多个试听请求可并发
         try:
-            pcm_bytes, _ = _call_volcengine_tts(
+            pcm_bytes, _ = await asyncio.to_thread(
+                _call_volcengine_tts,
                 text=req.text,
                 speaker=req.voice_id,
                 app_id=app_id,
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from typing import Optional
+from typing import Any, List, Optional
 
 from .base import ASRProvider
 
@@ -30,3 +30,19 @@ class DoubaoASRProvider(ASRProvider):
             language=kwargs.get("language", "zh-CN"),
         )
         return raw
+
+    def transcribe_many(self, audio_inputs: List[str], **kwargs) -> List[Any]:
+        """批量：全部提交后统一轮询。返回与输入对应的原始结果 dict 或异常。"""
+        from dubora_pipeline.processors.asr.impl import transcribe_many
+
+        print(f"[INFO] Doubao ASR 批量 {len(audio_inputs)} 个 (preset={kwargs.get('preset', 'asr_vad_spk')})...",
+              file=sys.stderr)
+        results = transcribe_many(
+            audio_inputs,
+            preset=kwargs.get("preset", "asr_vad_spk"),
+            appid=self.appid,
+            access_token=self.access_token,
+            hotwords=kwargs.get("hotwords"),
+            language=kwargs.get("language", "zh-CN"),
+        )
+        return [r if isinstance(r, Exception) else r[0] for r in results]
@@ -5,12 +5,11 @@
 
 import os
 import sys
-import time
 from typing import Optional
 
 import requests as http_requests
 
-from .base import ASRProvider
+from .base import ASRProvider, PollBackoff
 
 _BASE_URL = "https://dashscope.aliyuncs.com/api/v1"
 
@@ -46,6 +45,7 @@ class ParaformerASRProvider(ASRProvider):
         task_id = task_response.output.task_id
         print(f"[INFO] task_id={task_id}", file=sys.stderr)
 
+        backoff = PollBackoff()
         while True:
             result = Transcription.fetch(task=task_id)
             status = result.output.task_status
@@ -54,7 +54,7 @@ class ParaformerASRProvider(ASRProvider):
             elif status == "FAILED":
                 raise RuntimeError(f"失败: {getattr(result.output, 'message', 'Unknown')}")
             print(f"[INFO] 等待中... ({status})", file=sys.stderr)
-            time.sleep(3)
+            backoff.wait(status)
 
         # 下载转录结果
         task_results = getattr(result.output, "results", None) or []
@@ -7,12 +7,11 @@
 
 import os
 import sys
-import time
 from typing import Optional
 
 import requests as http_requests
 
-from .base import ASRProvider
+from .base import ASRProvider, PollBackoff
 
 _BASE_URL = "https://dashscope.aliyuncs.com/api/v1"
 
@@ -55,46 +54,49 @@ class QwenASRProvider(ASRProvider):
     def _transcribe_filetrans(self, audio_input: str) -> dict:
         print(f"[INFO] Qwen ASR filetrans ({self.model_name})...", file=sys.stderr)
 
-        resp = http_requests.post(
-            f"{_BASE_URL}/services/audio/asr/transcription",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "X-DashScope-Async": "enable",
-            },
-            json={
-                "model": self.model_name,
-                "input": {"file_url": audio_input},
-                "parameters": {"enable_itn": True, "enable_words": True},
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-        task_id = resp.json()["output"]["task_id"]
-        print(f"[INFO] task_id={task_id}", file=sys.stderr)
-
-        while True:
-            poll = http_requests.get(
-                f"{_BASE_URL}/tasks/{task_id}",
-                headers={"Authorization": f"Bearer {self.api_key}"},
+        # 提交 / 轮询 / 下载共用一个 Session，轮询期间复用同一条 TLS 连接
+        with http_requests.Session() as session:
+            resp = session.post(
+                f"{_BASE_URL}/services/audio/asr/transcription",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                    "X-DashScope-Async": "enable",
+                },
+                json={
+                    "model": self.model_name,
+                    "input": {"file_url": audio_input},
+                    "parameters": {"enable_itn": True, "enable_words": True},
+                },
                 timeout=30,
             )
-            poll.raise_for_status()
-            task = poll.json()
-            status = task["output"]["task_status"]
-
-            if status == "SUCCEEDED":
-                break
-            elif status == "FAILED":
-                raise RuntimeError(f"Qwen ASR 失败: {task['output'].get('message')}")
-            print(f"[INFO] 等待中... ({status})", file=sys.stderr)
-            time.sleep(3)
-
-        # 下载转录结果
-        transcript_url = task["output"].get("result", {}).get("transcription_url")
-        if transcript_url:
-            tr = http_requests.get(transcript_url, timeout=30)
-            tr.raise_for_status()
-            task["transcript"] = tr.json()
+            resp.raise_for_status()
+            task_id = resp.json()["output"]["task_id"]
+            print(f"[INFO] task_id={task_id}", file=sys.stderr)
+
+            backoff = PollBackoff()
+            while True:
+                poll = session.get(
+                    f"{_BASE_URL}/tasks/{task_id}",
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    timeout=30,
+                )
+                poll.raise_for_status()
+                task = poll.json()
+                status = task["output"]["task_status"]
+
+                if status == "SUCCEEDED":
+                    break
+                elif status == "FAILED":
+                    raise RuntimeError(f"Qwen ASR 失败: {task['output'].get('message')}")
+                print(f"[INFO] 等待中... ({status})", file=sys.stderr)
+                backoff.wait(status)
+
+            # 下载转录结果
+            transcript_url = task["output"].get("result", {}).get("transcription_url")
+            if transcript_url:
+                tr = session.get(transcript_url, timeout=30)
+                tr.raise_for_status()
+                task["transcript"] = tr.json()
 
         return task
@@ -7,10 +7,9 @@ pip install tencentcloud-sdk-python-asr
 
 import os
 import sys
-import time
 from typing import Optional
 
-from .base import ASRProvider
+from .base import ASRProvider, PollBackoff
 
 
 class TencentASRProvider(ASRProvider):
@@ -46,6 +45,7 @@ class TencentASRProvider(ASRProvider):
         task_id = resp.Data.TaskId
         print(f"[INFO] TaskId={task_id}", file=sys.stderr)
 
+        backoff = PollBackoff()
         while True:
             query = asr_models.DescribeTaskStatusRequest()
             query.TaskId = task_id
@@ -57,7 +57,7 @@ class TencentASRProvider(ASRProvider):
             elif data.StatusStr == "failed":
                 raise RuntimeError(f"腾讯云 ASR 失败: {data.ErrorMsg}")
             print(f"[INFO] 等待中... ({data.StatusStr})", file=sys.stderr)
-            time.sleep(3)
+            backoff.wait(data.StatusStr)
 
         return {
             "TaskId": data.TaskId,
@@ -19,10 +19,13 @@ from typing import Optional
 
 import requests
 
-from .base import ASRProvider
+from .base import ASRProvider, PollBackoff
 
 _HOST = "https://office-api-ist-dx.iflyaisol.com"
 
+# getResult 轮询总时长上限（原先固定 5s × 600 次）
+_POLL_TIMEOUT_S = 3000
+
 
 def _random_str(length=16) -> str:
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
@@ -137,54 +140,64 @@ class XfyunASRProvider(ASRProvider):
         signature = _make_signature(upload_params, self.api_secret)
         url = _build_url("/v2/upload", upload_params)
 
-        resp = requests.post(
-            url,
-            headers={"Content-Type": "application/octet-stream", "signature": signature},
-            timeout=30,
-        )
-        resp.raise_for_status()
-        result = resp.json()
-        if result.get("code") != "000000":
-            raise RuntimeError(f"讯飞 ASR 上传失败: {result.get('descInfo')} ({result.get('code')})")
-
-        order_id = result["content"]["orderId"]
-        print(f"[INFO] orderId={order_id}", file=sys.stderr)
-
-        # 2. poll getResult
-        for i in range(600):
-            query_params = {
-                "appId": self.app_id,
-                "accessKeyId": self.api_key,
-                "dateTime": _local_time_with_tz(),
-                "ts": str(int(time.time())),
-                "orderId": order_id,
-                "signatureRandom": sig_random,
-            }
-            query_sig = _make_signature(query_params, self.api_secret)
-            query_url = _build_url("/v2/getResult", query_params)
-
-            resp = requests.post(
-                query_url,
-                headers={"Content-Type": "application/json", "signature": query_sig},
-                data=json.dumps({}), timeout=15,
+        # upload / getResult 轮询共用一个 Session，轮询期间复用同一条 TLS 连接
+        with requests.Session() as session:
+            resp = session.post(
+                url,
+                headers={"Content-Type": "application/octet-stream", "signature": signature},
+                timeout=30,
             )
             resp.raise_for_status()
             result = resp.json()
-
             if result.get("code") != "000000":
-                raise RuntimeError(f"讯飞 ASR 查询失败: {result.get('descInfo')}")
-
-            status = result["content"]["orderInfo"]["status"]
-            if status == 4:
-                print("[INFO] 转写完成", file=sys.stderr)
-                break
-            if status not in (3,):
-                raise RuntimeError(f"讯飞 ASR 异常状态: {status}")
-
-            print(f"[INFO] 处理中... ({i + 1})", file=sys.stderr)
-            time.sleep(5)
-        else:
-            raise RuntimeError("讯飞 ASR 轮询超时")
+                raise RuntimeError(f"讯飞 ASR 上传失败: {result.get('descInfo')} ({result.get('code')})")
+
+            order_id = result["content"]["orderId"]
+            print(f"[INFO] orderId={order_id}", file=sys.stderr)
+
+            # 2. poll getResult：2s 起指数退避（上限 30s），总时长不超过 _POLL_TIMEOUT_S
+            deadline = time.monotonic() + _POLL_TIMEOUT_S
+            backoff = PollBackoff(initial=2.0, max_interval=30.0, factor=1.7, deadline=deadline)
+            poll_count = 0
+            while True:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError("讯飞 ASR 轮询超时")
+                poll_count += 1
+                query_params = {
+                    "appId": self.app_id,
+                    "accessKeyId": self.api_key,
+                    "dateTime": _local_time_with_tz(),
+                    "ts": str(int(time.time())),
+                    "orderId": order_id,
+                    "signatureRandom": sig_random,
+                }
+                query_sig = _make_signature(query_params, self.api_secret)
+                query_url = _build_url("/v2/getResult", query_params)
+
+                resp = session.post(
+                    query_url,
+                    headers={"Content-Type": "application/json", "signature": query_sig},
+                    data=json.dumps({}), timeout=15,
+                )
+                if resp.status_code == 429:
+                    print("[WARN] 讯飞 ASR 查询被限流，加大轮询间隔", file=sys.stderr)
+                    backoff.throttled()
+                    continue
+                resp.raise_for_status()
+                result = resp.json()
+
+                if result.get("code") != "000000":
+                    raise RuntimeError(f"讯飞 ASR 查询失败: {result.get('descInfo')}")
+
+                status = result["content"]["orderInfo"]["status"]
+                if status == 4:
+                    print("[INFO] 转写完成", file=sys.stderr)
+                    break
+                if status not in (3,):
+                    raise RuntimeError(f"讯飞 ASR 异常状态: {status}")
+
+                print(f"[INFO] 处理中... ({poll_count})", file=sys.stderr)
+                backoff.wait(str(status))
 
         # 3. parse
         sentences = _parse_order_result(result)
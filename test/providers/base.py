@@ -1,5 +1,7 @@
 """ASR / TTS provider 抽象基类。"""
 
+import random
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
@@ -34,6 +36,35 @@ class ASRProvider(ABC):
         ...
 
 
+class PollBackoff:
+    """异步任务轮询退避：间隔从 initial 起按 factor 增长至 max_interval，带随机抖动；
+    状态变化时重置为 initial。给定 deadline（time.monotonic() 时刻）时单次等待不越过它。"""
+
+    def __init__(self, initial: float = 3.0, max_interval: float = 30.0, factor: float = 1.5,
+                 deadline: Optional[float] = None):
+        self.initial = initial
+        self.max_interval = max_interval
+        self.factor = factor
+        self.deadline = deadline
+        self._delay = initial
+        self._last_status: Optional[str] = None
+
+    def wait(self, status: Optional[str] = None) -> None:
+        if status != self._last_status:
+            self._last_status = status
+            self._delay = self.initial
+        pause = self._delay + random.uniform(0, 0.25 * self._delay)
+        if self.deadline is not None:
+            pause = max(0.0, min(pause, self.deadline - time.monotonic()))
+        time.sleep(pause)
+        self._delay = min(self.max_interval, self._delay * self.factor)
+
+    def throttled(self) -> None:
+        """服务端限流（如 HTTP 429）：间隔翻倍后再等待。"""
+        self._delay = min(self.max_interval, self._delay * 2)
+        self.wait(self._last_status)
+
+
 # ── TTS ──────────────────────────────────────────────────────────────────────
 
 
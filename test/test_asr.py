@@ -4,6 +4,7 @@
 import argparse
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 _project_root = Path(__file__).resolve().parent.parent
@@ -11,7 +12,6 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from dubora_core.config.settings import load_env_file
-load_env_file(".env.test")
 
 _PROVIDERS = {
     "doubao":     ("providers.asr_doubao",     "DoubaoASRProvider"),
@@ -37,6 +37,8 @@ _EPILOG = """\
   %(prog)s -m funasr     --funasr-device cuda:0              -i audio.wav
   %(prog)s -m fish                                           -i audio.wav
   %(prog)s -m xfyun                                          -i audio.wav
+  %(prog)s -m doubao     -j 4                                -i a.wav b.wav c.wav
+  %(prog)s -m doubao     --reuse                             -i a.wav b.wav c.wav
 
 环境变量:
   doubao      DOUBAO_APPID, DOUBAO_ACCESS_TOKEN
@@ -68,12 +70,12 @@ def create_provider(args):
     return cls()
 
 
-def resolve_audio(args, provider):
+def resolve_audio(args, provider, input_arg: str):
     """根据 provider.input_type 准备音频输入。"""
-    if args.input.startswith(("http://", "https://")):
-        return args.input
+    if input_arg.startswith(("http://", "https://")):
+        return input_arg
 
-    path = Path(args.input).resolve()
+    path = Path(input_arg).resolve()
     if not path.exists():
         raise FileNotFoundError(f"音频文件不存在: {path}")
 
@@ -101,7 +103,8 @@ def resolve_audio(args, provider):
     return url
 
 
-def main():
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="ASR 测试 CLI — 多模型统一入口",
         epilog=_EPILOG,
@@ -110,12 +113,16 @@ def main():
 
     parser.add_argument("-m", "--model", required=True, choices=list(_PROVIDERS),
                         help="ASR 模型")
-    parser.add_argument("-i", "--input", required=True,
-                        help="音频文件路径或 URL")
+    parser.add_argument("-i", "--input", required=True, nargs="+",
+                        help="音频文件路径或 URL（可多个，共用一个 provider 并发转写）")
     parser.add_argument("-o", "--output",
-                        help="输出 JSON 路径 (默认 test_out/asr/{stem}_{model}.json)")
+                        help="输出 JSON 路径 (默认 test_out/asr/{stem}_{model}.json，仅单个输入时可用)")
+    parser.add_argument("-j", "--concurrency", type=int, default=4,
+                        help="多个输入时的并发数 (默认 4)")
     parser.add_argument("--key",
                         help="对象存储 blob key (默认自动推导)")
+    parser.add_argument("--reuse", action="store_true",
+                        help="输出 JSON 已存在则直接复用，不再重复调用（计费）接口")
 
     doubao = parser.add_argument_group("doubao")
     doubao.add_argument("--doubao-preset", default="asr_spk_semantic",
@@ -151,27 +158,130 @@ def main():
     funasr.add_argument("--funasr-device", default="cpu",
                         choices=["cpu", "cuda", "cuda:0", "cuda:1"],
                         help="设备 (默认 cpu)")
+    return parser
+
 
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
+    if args.output and len(args.input) > 1:
+        parser.error("-o/--output 仅支持单个输入")
+    if args.key and len(args.input) > 1:
+        parser.error("--key 仅支持单个输入")
 
+    load_env_file(".env.test")
+
+    # 同一输入重复出现只转写一次（保持原顺序）
+    args.input = list(dict.fromkeys(args.input))
     provider = create_provider(args)
-    audio_input = resolve_audio(args, provider)
-    print(f"[INFO] {args.model}: {args.input}", file=sys.stderr)
 
+    if len(args.input) == 1:
+        # 直接流式写到 stdout，不先拼出整段缩进 JSON 字符串
+        json.dump(run_one(args, provider, args.input[0]), sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+
+    # 多个输入：provider / SDK 只初始化一次，上传 + 提交 + 轮询在线程池中并发进行
+    from concurrent.futures import ThreadPoolExecutor
+
+    if hasattr(provider, "transcribe_many"):
+        errors = run_batch(args, provider)
+        for err in errors:
+            print(f"[ERROR] {err}", file=sys.stderr)
+        if errors:
+            sys.exit(1)
+        return
+
+    def _safe_run(input_arg: str):
+        try:
+            run_one(args, provider, input_arg)
+            return None
+        except Exception as e:
+            return f"{input_arg}: {e}"
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        errors = [e for e in executor.map(_safe_run, args.input) if e]
+    for err in errors:
+        print(f"[ERROR] {err}", file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+
+def run_batch(args, provider) -> list:
+    """支持批量的 provider：并发上传后一次性全部提交，再统一轮询（服务端并行处理）。返回错误列表。"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    errors = []
+    pending = [x for x in args.input if not _reusable(args, x)]
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        resolved = list(executor.map(lambda x: _safe_call(resolve_audio, args, provider, x), pending))
+
+    inputs, audio_inputs = [], []
+    for input_arg, audio in zip(pending, resolved):
+        if isinstance(audio, Exception):
+            errors.append(f"{input_arg}: {audio}")
+        else:
+            inputs.append(input_arg)
+            audio_inputs.append(audio)
+
+    results = provider.transcribe_many(audio_inputs, **provider_kwargs(args, inputs[0])) if inputs else []
+    for input_arg, result in zip(inputs, results):
+        if isinstance(result, Exception):
+            errors.append(f"{input_arg}: {result}")
+        else:
+            save_result(args, input_arg, result)
+    return errors
+
+
+def _safe_call(fn, *args):
+    try:
+        return fn(*args)
+    except Exception as e:
+        return e
+
+
+def provider_kwargs(args, input_arg: str) -> dict:
+    """provider 专属的 transcribe 参数。"""
     kwargs = {}
     if args.model == "doubao":
         kwargs = {"preset": args.doubao_preset}
         if args.doubao_hotwords:
             kwargs["hotwords"] = args.doubao_hotwords
-    elif args.model == "xfyun" and not args.input.startswith("http"):
+    elif args.model == "xfyun" and not input_arg.startswith("http"):
         import wave
-        with wave.open(args.input, 'rb') as wf:
+        with wave.open(input_arg, 'rb') as wf:
             kwargs["duration_ms"] = int(round(wf.getnframes() / wf.getframerate() * 1000))
+    return kwargs
+
+
+def run_one(args, provider, input_arg: str) -> dict:
+    """转写单个输入并保存 JSON，返回原始结果 dict。"""
+    if _reusable(args, input_arg):
+        with open(output_path(args, input_arg), "r", encoding="utf-8") as f:
+            return json.load(f)
 
-    result = provider.transcribe(audio_input, **kwargs)
-    json_str = json.dumps(result, ensure_ascii=False, indent=2)
+    audio_input = resolve_audio(args, provider, input_arg)
+    print(f"[INFO] {args.model}: {input_arg}", file=sys.stderr)
 
-    stem = Path(args.input).stem if not args.input.startswith("http") else "url_input"
+    result = provider.transcribe(audio_input, **provider_kwargs(args, input_arg))
+    save_result(args, input_arg, result)
+    return result
+
+
+def _reusable(args, input_arg: str) -> bool:
+    """--reuse 且该输入的输出 JSON 已存在（非空）。"""
+    if not args.reuse:
+        return False
+    out_path = output_path(args, input_arg)
+    if out_path.is_file() and out_path.stat().st_size > 0:
+        print(f"[INFO] 复用: {out_path}", file=sys.stderr)
+        return True
+    return False
+
+
+def output_path(args, input_arg: str) -> Path:
+    """输出 JSON 路径：-o 指定，否则 test_out/asr/{stem}_{model[-variant]}.json。"""
+    stem = Path(input_arg).stem if not input_arg.startswith("http") else "url_input"
     if args.output:
         out_path = Path(args.output)
     else:
@@ -187,15 +297,17 @@ def main():
         # 文件名安全（去掉斜杠等）
         extra_safe = extra.replace("/", "-") if extra else ""
         tail = f"{args.model}-{extra_safe}" if extra_safe else args.model
-        out_dir = Path("test_out/asr")
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / f"{stem}_{tail}.json"
+        out_path = Path("test_out/asr") / f"{stem}_{tail}.json"
+    return out_path
+
 
+def save_result(args, input_arg: str, result: dict) -> None:
+    """保存原始结果 JSON。"""
+    out_path = output_path(args, input_arg)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json_str, encoding="utf-8")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
     print(f"[INFO] 保存: {out_path}", file=sys.stderr)
-    print(json_str)
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,51 @@
+"""测试 DoubaoASRClient.poll_many 的批量轮询容错"""
+import json
+
+import requests
+
+from dubora_pipeline.models.doubao.client import DoubaoASRClient
+
+_DONE = {"result": {"text": "你好", "utterances": [{"text": "你好", "start_time": 0, "end_time": 500}]}}
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict):
+        self.status_code = 200
+        self.headers = {"X-Api-Status-Code": "20000000", "X-Api-Message": "OK"}
+        self.content = json.dumps(payload).encode("utf-8")
+
+
+class _FakeSession:
+    """按 X-Api-Request-Id 返回结果；failing 中的 id 每次查询都抛网络异常。"""
+
+    def __init__(self, failing: set):
+        self.failing = failing
+        self.calls = []
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        rid = headers["X-Api-Request-Id"]
+        self.calls.append(rid)
+        if rid in self.failing:
+            raise requests.ConnectionError(f"connection reset ({rid})")
+        return _FakeResponse(_DONE)
+
+
+def test_poll_many_keeps_finished_results_when_one_request_fails():
+    client = DoubaoASRClient(app_key="app", access_key="key")
+    client.session = _FakeSession(failing={"bad"})
+
+    results = client.poll_many(
+        ["ok-1", "bad", "ok-2"],
+        resource_id="volc.bigasr.auc",
+        poll_interval_s=0.01,
+        max_poll_interval_s=0.01,
+        max_wait_s=0.1,
+    )
+
+    assert results["ok-1"] == _DONE
+    assert results["ok-2"] == _DONE
+    assert isinstance(results["bad"], TimeoutError)
+    assert "connection reset" in str(results["bad"])
+    # 失败的任务留在 pending 里被多次重试，已完成的任务不再查询
+    assert client.session.calls.count("bad") > 1
+    assert client.session.calls.count("ok-1") == 1
@@ -0,0 +1,29 @@
+"""测试 NameGuard 的占位符拼接"""
+from dubora_pipeline.processors.mt.name_guard import _apply_replacements
+
+
+def _reverse_slice(part, replacements):
+    """原实现：从后往前逐个切片替换"""
+    for start_pos, end_pos, placeholder in sorted(replacements, key=lambda x: x[0], reverse=True):
+        part = part[:start_pos] + placeholder + part[end_pos:]
+    return part
+
+
+def test_non_overlapping_matches_reverse_slicing():
+    part = "平安哥，王师傅叫你，平安"
+    replacements = [(10, 12, "<<NAME_0>>"), (0, 2, "<<NAME_0>>"), (4, 5, "<<NAME_1>>")]
+
+    assert _apply_replacements(part, replacements) == _reverse_slice(part, replacements)
+    assert _apply_replacements(part, replacements) == "<<NAME_0>>哥，<<NAME_1>>师傅叫你，<<NAME_0>>"
+
+
+def test_overlapping_candidate_is_skipped():
+    part = "小李平安哥来了"
+    # 第一轮 4 字 / 3 字滑窗给出的重叠候选："小李平" 与 "平安"
+    replacements = [(2, 4, "<<NAME_1>>"), (0, 3, "<<NAME_0>>")]
+
+    assert _apply_replacements(part, replacements) == "<<NAME_0>>安哥来了"
+
+
+def test_no_replacements_returns_part():
+    assert _apply_replacements("你好", []) == "你好"
@@ -0,0 +1,22 @@
+"""测试 load_prompt 的渲染缓存"""
+import pytest
+
+from dubora_pipeline.prompts import load_prompt
+
+
+def test_render_cache_distinguishes_equal_hashing_values():
+    p_int = load_prompt("mt_utterance_translate.retry_level_1", budget_sec=2, max_chars=35)
+    p_float = load_prompt("mt_utterance_translate.retry_level_1", budget_sec=2.0, max_chars=35)
+
+    assert p_int.text != p_float.text
+    assert "2.0" in p_float.text
+    assert load_prompt("mt_utterance_translate.retry_level_1", budget_sec=True, max_chars=35).text != \
+        load_prompt("mt_utterance_translate.retry_level_1", budget_sec=1, max_chars=35).text
+
+
+def test_rendered_prompt_is_read_only():
+    p = load_prompt("mt_utterance_translate.retry_level_1", budget_sec="2.50", max_chars="35")
+    with pytest.raises(AttributeError):
+        p.text = "changed"
+    again = load_prompt("mt_utterance_translate.retry_level_1", budget_sec="2.50", max_chars="35")
+    assert again.text == p.text != "changed"
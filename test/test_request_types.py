@@ -16,8 +16,15 @@ def _make_request(**request_kwargs) -> DoubaoASRRequest:
     )
 
 
-def test_vad_segment_requires_end_window_size():
-    req = _make_request(vad_segment=True, end_window_size=None)
+@pytest.mark.parametrize(
+    "request_kwargs",
+    [
+        pytest.param(dict(vad_segment=True, end_window_size=None), id="vad_segment_requires_end_window_size"),
+        pytest.param(dict(ssd_version="200", enable_speaker_info=False), id="ssd_version_requires_speaker_info"),
+    ],
+)
+def test_invalid_request_config(request_kwargs):
+    req = _make_request(**request_kwargs)
     with pytest.raises(ValueError):
         req.validate()
 
@@ -33,12 +40,6 @@ def test_channel_split_requires_multi_channel():
         req.validate()
 
 
-def test_ssd_version_requires_speaker_info():
-    req = _make_request(ssd_version="200", enable_speaker_info=False)
-    with pytest.raises(ValueError):
-        req.validate()
-
-
 def test_corpus_config_from_hotwords():
     corpus = CorpusConfig.from_hotwords(["平安", "平安哥", "哥"])
     assert corpus.context is not None
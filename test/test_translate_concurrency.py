@@ -0,0 +1,60 @@
+"""测试 translate phase 的并发翻译收尾：失败后停止写入、已写 cue 的 utterance 照常收尾"""
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from dubora_pipeline.phases.translate import _translate_concurrently, _WriteGate  # noqa: E402
+
+
+def _work(n: int):
+    return [({"id": i}, [{"id": i}]) for i in range(n)]
+
+
+def test_all_succeed_finalizes_every_utterance():
+    finalized = []
+    failure = _translate_concurrently(
+        _work(6), lambda item: True, lambda utt, ok: finalized.append(utt["id"]), _WriteGate(), 3,
+    )
+    assert failure is None
+    assert sorted(finalized) == list(range(6))
+
+
+def test_failure_stops_writes_and_skips_unstarted_work():
+    gate = _WriteGate()
+    started, written, finalized = [], [], []
+    in_flight = threading.Event()
+
+    def translate_one(item):
+        utt, _ = item
+        started.append(utt["id"])
+        if utt["id"] == 0:
+            # 与失败任务同时在跑的请求：等失败发生后才尝试写入
+            in_flight.set()
+            time.sleep(0.1)
+        elif utt["id"] == 1:
+            in_flight.wait()
+            raise RuntimeError("LLM error")
+        else:
+            time.sleep(0.02)
+        with gate.lock:
+            if gate.stopped:
+                return None
+            written.append(utt["id"])
+        return True
+
+    failure = _translate_concurrently(
+        _work(10), translate_one, lambda utt, ok: finalized.append(utt["id"]), gate, 2,
+    )
+
+    assert failure is not None
+    utt, exc = failure
+    assert utt["id"] == 1 and isinstance(exc, RuntimeError)
+    assert gate.stopped
+    # 进行中的任务被拒绝写入；写过 cue 的都已收尾
+    assert 0 not in written
+    assert sorted(finalized) == sorted(written)
+    # 失败后尚未开始的任务被取消
+    assert len(started) < 10
@@ -40,8 +40,6 @@ if str(_project_root) not in sys.path:
 
 from dubora_core.config.settings import load_env_file
 
-load_env_file(".env.test")
-
 # 各模型默认音色
 DEFAULT_VOICES = {
     "volcengine": "zh_female_shuangkuaisisi_moon_bigtts",
@@ -238,6 +236,7 @@ def main():
     )
 
     args = parser.parse_args()
+    load_env_file(".env.test")
 
     out_dir = Path(args.output) if args.output else Path("test_out/tts")
     voice = args.voice or DEFAULT_VOICES.get(args.model, "")
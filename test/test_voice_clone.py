@@ -58,8 +58,6 @@ if str(_project_root) not in sys.path:
 
 from dubora_core.config.settings import load_env_file
 
-load_env_file(".env.test")
-
 # ── Constants ────────────────────────────────────────────────────────────────
 
 VOICE_CLONE_URL = "https://openspeech.bytedance.com/api/v3/tts/voice_clone"
@@ -674,6 +672,7 @@ def main():
                         help="只查询指定的 speaker_id 列表 (不传则查询全部)")
 
     args = parser.parse_args()
+    load_env_file(".env.test")
 
     {
         "cut": cmd_cut,